@@ -20,13 +20,14 @@ Run: python3 chrome_forge.py
 
 import os
 import json
+import math
 import re
-import shutil
 import sys
-import uuid
-from datetime import datetime
+import time
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set, Any, Optional, Tuple
+from typing import Dict, List, Set, Any, Optional, Tuple, Iterable, FrozenSet
 
 # ============================================================================
 # CONFIGURATION AND CONSTANTS
@@ -69,17 +70,42 @@ INTENT_CATEGORIES = {
     }
 }
 
+class _PromptCleanTable(dict):
+    """str.translate table that maps anything but word characters, whitespace,
+    hyphens, dots and @ to a space. Entries are filled in on first lookup."""
+    
+    def __missing__(self, code: int) -> int:
+        char = chr(code)
+        keep = char.isalnum() or char.isspace() or char in "_-.@"
+        self[code] = code if keep else 32
+        return self[code]
+
+
+_PROMPT_CLEAN_TABLE = _PromptCleanTable()
+
+# Shared encoder for manifest.json and rules.json; json.dumps with keyword
+# options builds a fresh JSONEncoder on every call. Both documents are trees
+# built here, so the circular-reference bookkeeping is skipped.
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, check_circular=False)
+
+# Characters stripped from the prompt when deriving the manifest name
+_MANIFEST_NAME_CLEAN_RE = re.compile(r'[^\w\s\-]')
+
 # Entity recognition patterns
-ENTITY_PATTERNS = {
+_ENTITY_PATTERNS_RAW = {
     "target_websites": r"(?:on|for|in|from)\s+(?:(?:https?://)?(?:www\.)?)?([a-z0-9\-]+\.(?:com|org|net|io|edu|gov))",
     "social_media": r"\b(facebook|twitter|tiktok|instagram|youtube|reddit|linkedin|snapchat)\b",
     "visual_elements": r"\b(color|style|theme|font|size|highlight|background|border|red|blue|green|yellow|dark|light)\b",
     "interaction_triggers": r"\b(when|after|before|on\s+(?:click|hover|load|open|start))\b",
     "data_elements": r"\b(date|time|phone\s*(?:number)?|email|image|link|url|text|number)\b",
-    "time_patterns": r"\b(\d{1,2})\s*(?:am|pm|AM|PM|:00)\b",
+    "time_patterns": r"\b(\d{1,2})\s*(?:am|pm|:00)\b",
     "scheduling": r"\b(every\s+(?:\d+\s+)?(?:second|minute|hour|day)|daily|hourly|periodically)\b"
 }
 
+# Compiled once at import so extract_entities never re-parses a pattern
+ENTITY_PATTERNS = {name: re.compile(pattern, re.IGNORECASE)
+                   for name, pattern in _ENTITY_PATTERNS_RAW.items()}
+
 # Permission mapping with triggers
 PERMISSION_MAP = {
     "activeTab": {
@@ -128,6 +154,174 @@ PERMISSION_MAP = {
     }
 }
 
+# A valid prompt must contain at least one of these verbs
+ACTION_VERBS = frozenset(["create", "make", "build", "show", "display", "block", "highlight",
+                          "change", "modify", "extract", "save", "store", "find", "search", "add"])
+
+# Keywords that force a component on regardless of intent confidence
+COMPONENT_KEYWORDS = {
+    "popup": frozenset(["popup", "button", "menu", "click"]),
+    "content_script": frozenset(["highlight", "modify", "change", "webpage",
+                                 "page", "website", "extract", "find", "dom"]),
+    "background": frozenset(["block", "background", "alarm", "timer",
+                             "startup", "browser opens", "schedule"]),
+    "css": frozenset(["style", "css", "theme", "color", "highlight"])
+}
+
+# Color names mapped to hex values; the first listed color found wins
+COLOR_MAP = {
+    "red": "#ff4444",
+    "blue": "#4285f4",
+    "green": "#34a853",
+    "yellow": "#fbbc05",
+    "orange": "#ff9800",
+    "purple": "#9c27b0",
+    "dark": "#2d2d2d",
+    "light": "#ffffff",
+    "black": "#000000",
+    "white": "#ffffff"
+}
+
+# Feature detection keyword groups
+FEATURE_KEYWORDS = {
+    "show_date": ["date", "today", "current date", "time", "clock"],
+    "find_action": ["highlight", "find", "extract", "show"],
+    "change_color": ["text to blue", "change color", "text color"],
+    "time_based": ["work hours", "during", "between"],
+    "refresh_timer": ["refresh", "update", "every second", "real-time"],
+    "dark_mode": ["mode", "theme"]
+}
+
+# Single words analyze() tests directly against the keyword hits, outside
+# any of the keyword groups above
+_EXTRA_AUTOMATON_KEYWORDS = ("phone", "email", "block", "social media", "copy", "dark")
+
+# Social sites that can be blocked, mapped to their domains
+SOCIAL_SITES = {
+    "facebook": "facebook.com",
+    "tiktok": "tiktok.com",
+    "twitter": "twitter.com",
+    "instagram": "instagram.com",
+    "youtube": "youtube.com",
+    "reddit": "reddit.com",
+    "linkedin": "linkedin.com",
+    "snapchat": "snapchat.com"
+}
+DEFAULT_SOCIAL_DOMAINS = ["facebook.com", "twitter.com", "tiktok.com", "instagram.com"]
+# Sites that turn blocking on when named anywhere in the prompt; the others
+# only count as whole words, through the social_media entity pattern
+BLOCK_TRIGGER_SITES = frozenset(["facebook", "tiktok", "twitter", "instagram", "youtube"])
+
+# Literals at least one of which must appear for an entity pattern to match;
+# patterns whose literals are all absent from the keyword hits are skipped
+ENTITY_LITERALS = {
+    "target_websites": frozenset([".com", ".org", ".net", ".io", ".edu", ".gov"]),
+    "social_media": frozenset(["facebook", "twitter", "tiktok", "instagram",
+                               "youtube", "reddit", "linkedin", "snapchat"]),
+    "visual_elements": frozenset(["color", "style", "theme", "font", "size", "highlight",
+                                  "background", "border", "red", "blue", "green",
+                                  "yellow", "dark", "light"]),
+    "interaction_triggers": frozenset(["when", "after", "before", "on"]),
+    "data_elements": frozenset(["date", "time", "phone", "email", "image",
+                                "link", "url", "text", "number"]),
+    "scheduling": frozenset(["every", "daily", "hourly", "periodically"])
+}
+
+
+# ============================================================================
+# KEYWORD MATCHING
+# ============================================================================
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton that finds every keyword in a single pass."""
+    
+    __slots__ = ("_goto", "_fail", "_output")
+    
+    def __init__(self, keywords: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[str, ...]] = [()]
+        
+        for keyword in dict.fromkeys(keywords):
+            self._add(keyword)
+        self._link()
+    
+    def _add(self, keyword: str):
+        """Insert a keyword into the trie."""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] += (keyword,)
+    
+    def _link(self):
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+    
+    def scan(self, text: str) -> FrozenSet[str]:
+        """Return the set of keywords occurring anywhere in text."""
+        goto, fail, output = self._goto, self._fail, self._output
+        hits = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                hits.update(output[state])
+        return frozenset(hits)
+
+
+# Every keyword the analyzer looks up, matched as a substring in one pass
+KEYWORD_AUTOMATON = KeywordAutomaton(
+    [kw for config in INTENT_CATEGORIES.values() for kw in config["keywords"]] +
+    [trigger for config in PERMISSION_MAP.values() for trigger in config["triggers"]] +
+    [kw for keywords in COMPONENT_KEYWORDS.values() for kw in keywords] +
+    [kw for keywords in FEATURE_KEYWORDS.values() for kw in keywords] +
+    list(_EXTRA_AUTOMATON_KEYWORDS) +
+    list(COLOR_MAP) +
+    list(SOCIAL_SITES) +
+    list(ACTION_VERBS) +
+    [literal for literals in ENTITY_LITERALS.values() for literal in literals]
+)
+
+def _confidence_table(keyword_count: int, weight: float) -> Tuple[float, ...]:
+    """Precompute the weighted confidence for every possible match count."""
+    table = []
+    for matches in range(keyword_count + 1):
+        base_confidence = min(matches / keyword_count * 2, 1.0)
+        table.append(min(base_confidence * weight, 1.0))
+    return tuple(table)
+
+
+# Flattened scoring tables: (intent, keyword set, confidence by match count)
+# and (permission, trigger set), built once so the hot loops skip the
+# nested config dict lookups and the confidence arithmetic.
+_INTENT_TABLE = tuple(
+    (intent, frozenset(config["keywords"]),
+     _confidence_table(len(config["keywords"]), config["weight"]))
+    for intent, config in INTENT_CATEGORIES.items()
+)
+_PERMISSION_TABLE = tuple(
+    (perm, frozenset(config["triggers"]))
+    for perm, config in PERMISSION_MAP.items()
+)
+
 
 # ============================================================================
 # PART A: PROMPT ANALYSIS ENGINE
@@ -136,18 +330,23 @@ PERMISSION_MAP = {
 class PromptAnalyzer:
     """Natural Language Processing engine for understanding user intent."""
     
+    __slots__ = ("raw_prompt", "normalized_prompt", "keyword_hits", "analysis_result")
+    
     def __init__(self, prompt: str):
         self.raw_prompt = prompt
         self.normalized_prompt = self._normalize(prompt)
-        self.tokens = self._tokenize(self.normalized_prompt)
+        self.keyword_hits = KEYWORD_AUTOMATON.scan(self.normalized_prompt)
         self.analysis_result = {}
     
     def _normalize(self, text: str) -> str:
         """Normalize text for processing."""
-        text = text.lower().strip()
-        text = re.sub(r'\s+', ' ', text)  # Multiple spaces to single
-        text = re.sub(r'[^\w\s\-\.\@]', ' ', text)  # Keep alphanumeric, spaces, hyphens, dots, @
-        return text
+        text = ' '.join(text.lower().split())  # Trim, multiple spaces to single
+        return text.translate(_PROMPT_CLEAN_TABLE)  # Keep alphanumeric, spaces, hyphens, dots, @
+    
+    @property
+    def tokens(self) -> List[str]:
+        """Prompt tokens, split on demand; keyword matching uses keyword_hits."""
+        return self._tokenize(self.normalized_prompt)
     
     def _tokenize(self, text: str) -> List[str]:
         """Split text into tokens."""
@@ -161,10 +360,7 @@ class PromptAnalyzer:
             return False, f"Prompt too long. Maximum {MAX_PROMPT_LENGTH} characters allowed."
         
         # Check for action verb
-        action_verbs = ["create", "make", "build", "show", "display", "block", "highlight", 
-                       "change", "modify", "extract", "save", "store", "find", "search", "add"]
-        has_action = any(verb in self.normalized_prompt for verb in action_verbs)
-        if not has_action:
+        if ACTION_VERBS.isdisjoint(self.keyword_hits):
             return False, "Please include an action verb (create, make, show, block, highlight, etc.)"
         
         return True, "Valid prompt"
@@ -173,24 +369,27 @@ class PromptAnalyzer:
         """Classify user intent with confidence scores."""
         scores = {}
         
-        for intent, config in INTENT_CATEGORIES.items():
-            matches = sum(1 for kw in config["keywords"] if kw in self.normalized_prompt)
+        for intent, keywords, confidence in _INTENT_TABLE:
+            matches = len(keywords & self.keyword_hits)
             if matches > 0:
-                # Calculate confidence based on keyword matches and weight
-                base_confidence = min(matches / len(config["keywords"]) * 2, 1.0)
-                weighted_confidence = base_confidence * config["weight"]
-                scores[intent] = min(weighted_confidence, 1.0)
+                # Confidence based on keyword matches and weight, precomputed
+                scores[intent] = confidence[matches]
         
         return scores
     
     def extract_entities(self) -> Dict[str, List[str]]:
         """Extract named entities from prompt."""
         entities = {}
+        prompt = self.normalized_prompt
+        hits = self.keyword_hits
         
         for entity_type, pattern in ENTITY_PATTERNS.items():
-            matches = re.findall(pattern, self.normalized_prompt, re.IGNORECASE)
+            literals = ENTITY_LITERALS.get(entity_type)
+            if literals is not None and hits.isdisjoint(literals):
+                continue
+            matches = pattern.findall(prompt)
             if matches:
-                entities[entity_type] = list(set(matches))
+                entities[entity_type] = list(dict.fromkeys(matches))
         
         return entities
     
@@ -198,34 +397,22 @@ class PromptAnalyzer:
         """Detect required permissions based on triggers."""
         permissions = set()
         
-        for perm, config in PERMISSION_MAP.items():
-            for trigger in config["triggers"]:
-                if trigger in self.normalized_prompt:
-                    permissions.add(perm)
-                    break
+        for perm, triggers in _PERMISSION_TABLE:
+            if not self.keyword_hits.isdisjoint(triggers):
+                permissions.add(perm)
         
         return permissions
     
     def detect_color_scheme(self) -> Optional[str]:
         """Detect color preferences from prompt."""
-        color_map = {
-            "red": "#ff4444",
-            "blue": "#4285f4",
-            "green": "#34a853",
-            "yellow": "#fbbc05",
-            "orange": "#ff9800",
-            "purple": "#9c27b0",
-            "dark": "#2d2d2d",
-            "light": "#ffffff",
-            "black": "#000000",
-            "white": "#ffffff"
-        }
+        # Most prompts name no color; one intersection settles that
+        if self.keyword_hits.isdisjoint(COLOR_MAP):
+            return None
         
-        for color, hex_val in color_map.items():
-            if color in self.normalized_prompt:
+        # COLOR_MAP order is the priority order
+        for color, hex_val in COLOR_MAP.items():
+            if color in self.keyword_hits:
                 return hex_val
-        
-        return None
     
     def analyze(self) -> Dict[str, Any]:
         """Perform complete analysis of the prompt."""
@@ -245,52 +432,48 @@ class PromptAnalyzer:
         color = self.detect_color_scheme()
         
         # Determine required components
+        hits = self.keyword_hits
+        feature_keywords = FEATURE_KEYWORDS
+        
         needs_popup = intents.get("ui_interaction", 0) > 0.3 or \
-                     any(w in self.normalized_prompt for w in ["popup", "button", "menu", "click"])
+                     not hits.isdisjoint(COMPONENT_KEYWORDS["popup"])
         
         needs_content_script = intents.get("content_modification", 0) > 0.3 or \
-                              any(w in self.normalized_prompt for w in ["highlight", "modify", "change", "webpage", 
-                                                                        "page", "website", "extract", "find", "dom"])
+                              not hits.isdisjoint(COMPONENT_KEYWORDS["content_script"])
         
         needs_background = intents.get("background_automation", 0) > 0.3 or \
-                          any(w in self.normalized_prompt for w in ["block", "background", "alarm", "timer", 
-                                                                    "startup", "browser opens", "schedule"])
+                          not hits.isdisjoint(COMPONENT_KEYWORDS["background"])
         
         needs_storage = "storage" in permissions or intents.get("data_storage", 0) > 0.4
         
         needs_css = color is not None or \
-                   any(w in self.normalized_prompt for w in ["style", "css", "theme", "color", "highlight"])
+                   not hits.isdisjoint(COMPONENT_KEYWORDS["css"])
         
         # Specific feature detection
+        # Cheapest test first in every flag, so absent keywords short-circuit
         features = {
-            "show_date": any(w in self.normalized_prompt for w in ["date", "today", "current date", "time", "clock"]),
-            "highlight_phone": "phone" in self.normalized_prompt and \
-                              any(w in self.normalized_prompt for w in ["highlight", "find", "extract", "show"]),
-            "highlight_email": "email" in self.normalized_prompt and \
-                              any(w in self.normalized_prompt for w in ["highlight", "find", "extract", "show"]),
-            "block_sites": "block" in self.normalized_prompt and \
-                          ("social_media" in entities or "social media" in self.normalized_prompt or 
-                           any(site in self.normalized_prompt 
-                           for site in ["facebook", "tiktok", "twitter", "instagram", "youtube"])),
-            "change_color": any(w in self.normalized_prompt for w in ["text to blue", "change color", "text color"]),
-            "time_based": bool(entities.get("time_patterns")) or \
-                         any(w in self.normalized_prompt for w in ["work hours", "during", "between"]),
-            "refresh_timer": any(w in self.normalized_prompt for w in ["refresh", "update", "every second", "real-time"]),
-            "copy_feature": "copy" in self.normalized_prompt,
-            "dark_mode": "dark" in self.normalized_prompt and any(w in self.normalized_prompt for w in ["mode", "theme"]),
+            "show_date": not hits.isdisjoint(feature_keywords["show_date"]),
+            "highlight_phone": "phone" in hits and \
+                              not hits.isdisjoint(feature_keywords["find_action"]),
+            "highlight_email": "email" in hits and \
+                              not hits.isdisjoint(feature_keywords["find_action"]),
+            "block_sites": "block" in hits and \
+                          ("social_media" in entities or "social media" in hits or
+                           not hits.isdisjoint(BLOCK_TRIGGER_SITES)),
+            "change_color": not hits.isdisjoint(feature_keywords["change_color"]),
+            "time_based": "time_patterns" in entities or \
+                         not hits.isdisjoint(feature_keywords["time_based"]),
+            "refresh_timer": not hits.isdisjoint(feature_keywords["refresh_timer"]),
+            "copy_feature": "copy" in hits,
+            "dark_mode": "dark" in hits and not hits.isdisjoint(feature_keywords["dark_mode"]),
         }
         
         # Build blocked sites list
         blocked_sites = []
         if features["block_sites"]:
-            social_sites = {"facebook": "facebook.com", "tiktok": "tiktok.com", "twitter": "twitter.com",
-                          "instagram": "instagram.com", "youtube": "youtube.com", "reddit": "reddit.com",
-                          "linkedin": "linkedin.com", "snapchat": "snapchat.com"}
-            for site, domain in social_sites.items():
-                if site in self.normalized_prompt:
-                    blocked_sites.append(domain)
-            if not blocked_sites and "social media" in self.normalized_prompt:
-                blocked_sites = ["facebook.com", "twitter.com", "tiktok.com", "instagram.com"]
+            blocked_sites = [domain for site, domain in SOCIAL_SITES.items() if site in hits]
+            if not blocked_sites and "social media" in hits:
+                blocked_sites = list(DEFAULT_SOCIAL_DOMAINS)
         
         self.analysis_result = {
             "valid": is_valid,
@@ -313,6 +496,29 @@ class PromptAnalyzer:
         }
         
         return self.analysis_result
+    
+    @classmethod
+    def analyze_prompt(cls, prompt: str) -> Dict[str, Any]:
+        """Analyze a prompt, reusing the result of an identical earlier prompt."""
+        return _copy_analysis(_analyze_cached(prompt))
+
+
+@lru_cache(maxsize=64)
+def _analyze_cached(prompt: str) -> Dict[str, Any]:
+    """Memoized analysis keyed on the raw prompt; never hand out directly."""
+    return PromptAnalyzer(prompt).analyze()
+
+
+def _copy_analysis(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an analysis result deep enough that callers can mutate it freely."""
+    result = dict(analysis)
+    result["intents"] = dict(analysis["intents"])
+    result["entities"] = {name: list(found) for name, found in analysis["entities"].items()}
+    result["permissions"] = set(analysis["permissions"])
+    result["components"] = dict(analysis["components"])
+    result["features"] = dict(analysis["features"])
+    result["blocked_sites"] = list(analysis["blocked_sites"])
+    return result
 
 
 # ============================================================================
@@ -322,6 +528,8 @@ class PromptAnalyzer:
 class ManifestBuilder:
     """Generate Manifest V3 compliant JSON."""
     
+    __slots__ = ("analysis", "manifest")
+    
     def __init__(self, analysis: Dict[str, Any]):
         self.analysis = analysis
         self.manifest = {}
@@ -331,7 +539,7 @@ class ManifestBuilder:
         # Required fields (MV3)
         name = self.analysis["raw_prompt"][:50].strip() or "ChromeForge Extension"
         # Clean name for manifest
-        name = re.sub(r'[^\w\s\-]', '', name).strip()
+        name = _MANIFEST_NAME_CLEAN_RE.sub('', name).strip()
         
         self.manifest = {
             "manifest_version": 3,
@@ -340,8 +548,11 @@ class ManifestBuilder:
             "description": f"Auto-generated extension: {self.analysis['raw_prompt'][:100]}"
         }
         
+        components = self.analysis["components"]
+        features = self.analysis["features"]
+        
         # Action (popup)
-        if self.analysis["components"]["popup"]:
+        if components["popup"]:
             self.manifest["action"] = {
                 "default_popup": "popup.html",
                 "default_title": name[:30]
@@ -350,19 +561,19 @@ class ManifestBuilder:
             self.manifest["action"] = {}
         
         # Background service worker
-        if self.analysis["components"]["background"]:
+        if components["background"]:
             self.manifest["background"] = {
                 "service_worker": "background.js"
             }
         
         # Content scripts
-        if self.analysis["components"]["content_script"]:
+        if components["content_script"]:
             content_script_config = {
                 "matches": ["<all_urls>"],
                 "js": ["content.js"],
                 "run_at": "document_idle"
             }
-            if self.analysis["components"]["css"]:
+            if components["css"]:
                 content_script_config["css"] = ["styles.css"]
             self.manifest["content_scripts"] = [content_script_config]
         
@@ -370,27 +581,27 @@ class ManifestBuilder:
         permissions = set(self.analysis["permissions"])
         
         # Add implicit permissions based on components
-        if self.analysis["components"]["content_script"]:
+        if components["content_script"]:
             permissions.add("activeTab")
-        if self.analysis["components"]["storage"]:
+        if components["storage"]:
             permissions.add("storage")
-        if self.analysis["features"]["block_sites"]:
+        if features["block_sites"]:
             permissions.add("declarativeNetRequest")
             permissions.add("declarativeNetRequestWithHostAccess")
-        if self.analysis["features"]["time_based"] or self.analysis["features"]["refresh_timer"]:
+        if features["time_based"] or features["refresh_timer"]:
             permissions.add("alarms")
         
         if permissions:
-            self.manifest["permissions"] = sorted(list(permissions))
+            self.manifest["permissions"] = sorted(permissions)
         
         # Host permissions for blocking
         if self.analysis["blocked_sites"]:
-            host_perms = [f"*://*.{site}/*" for site in self.analysis["blocked_sites"]]
-            host_perms.append("<all_urls>")
-            self.manifest["host_permissions"] = list(set(host_perms))
+            host_perms = {f"*://*.{site}/*" for site in self.analysis["blocked_sites"]}
+            host_perms.add("<all_urls>")
+            self.manifest["host_permissions"] = sorted(host_perms)
         
         # DeclarativeNetRequest rules for blocking
-        if self.analysis["features"]["block_sites"]:
+        if features["block_sites"]:
             self.manifest["declarative_net_request"] = {
                 "rule_resources": [{
                     "id": "ruleset_1",
@@ -428,35 +639,18 @@ class ManifestBuilder:
 # PART C: DYNAMIC CODE GENERATION
 # ============================================================================
 
-class CodeGenerator:
-    """Generate extension code files based on analysis."""
-    
-    def __init__(self, analysis: Dict[str, Any]):
-        self.analysis = analysis
-        self.files = {}
-    
-    def generate_popup_html(self) -> str:
-        """Generate popup.html file."""
-        features = self.analysis["features"]
-        color = self.analysis["color_scheme"] or "#4285f4"
-        
-        title = "Extension Popup"
-        button_text = "Run Action"
-        
-        if features["show_date"]:
-            title = "Date & Time"
-            button_text = "Refresh"
-        elif features["change_color"]:
-            title = "Page Modifier"
-            button_text = "Change Color"
-        elif features["highlight_phone"]:
-            title = "Phone Finder"
-            button_text = "Find Phones"
-        elif features["highlight_email"]:
-            title = "Email Finder"
-            button_text = "Find Emails"
-        
-        html = f'''<!DOCTYPE html>
+# Popup (title, button text) by feature; the first enabled feature wins
+POPUP_LABELS = (
+    ("show_date", "Date & Time", "Refresh"),
+    ("change_color", "Page Modifier", "Change Color"),
+    ("highlight_phone", "Phone Finder", "Find Phones"),
+    ("highlight_email", "Email Finder", "Find Emails"),
+)
+DEFAULT_POPUP_LABELS = ("Extension Popup", "Run Action")
+
+# popup.html and popup.js building blocks. Static pieces are plain strings;
+# the ones with blanks are filled with str.format
+POPUP_HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
@@ -474,23 +668,16 @@ class CodeGenerator:
   <script src="popup.js"></script>
 </body>
 </html>'''
-        return html
-    
-    def generate_popup_js(self) -> str:
-        """Generate popup.js file."""
-        features = self.analysis["features"]
-        
-        base_code = '''// ChromeForge Generated Popup Script
+
+POPUP_JS_HEADER = '''// ChromeForge Generated Popup Script
 document.addEventListener('DOMContentLoaded', function() {
   const actionBtn = document.getElementById('actionBtn');
   const output = document.getElementById('output');
   const status = document.getElementById('status');
   
 '''
-        
-        if features["show_date"]:
-            # Date/time display with optional refresh
-            action_code = '''  function updateDateTime() {
+
+POPUP_JS_DATE = '''  function updateDateTime() {
     const now = new Date();
     const options = { 
       weekday: 'long', 
@@ -506,15 +693,13 @@ document.addEventListener('DOMContentLoaded', function() {
   
   updateDateTime();
 '''
-            if features["refresh_timer"]:
-                action_code += '''  setInterval(updateDateTime, 1000);
+POPUP_JS_DATE_REFRESH = '''  setInterval(updateDateTime, 1000);
 '''
-            action_code += '''
+POPUP_JS_DATE_BUTTON = '''
   actionBtn.addEventListener('click', updateDateTime);
 '''
-        
-        elif features["change_color"] or "blue" in self.analysis["normalized_prompt"]:
-            action_code = '''  actionBtn.addEventListener('click', async () => {
+
+POPUP_JS_CHANGE_COLOR = '''  actionBtn.addEventListener('click', async () => {
     try {
       const [tab] = await chrome.tabs.query({active: true, currentWindow: true});
       await chrome.tabs.sendMessage(tab.id, {action: 'changeColor', color: 'blue'});
@@ -526,13 +711,11 @@ document.addEventListener('DOMContentLoaded', function() {
     }
   });
 '''
-        
-        elif features["highlight_phone"] or features["highlight_email"]:
-            data_type = "phones" if features["highlight_phone"] else "emails"
-            action_code = f'''  actionBtn.addEventListener('click', async () => {{
+
+POPUP_JS_HIGHLIGHT_TEMPLATE = '''  actionBtn.addEventListener('click', async () => {{
     try {{
       const [tab] = await chrome.tabs.query({{active: true, currentWindow: true}});
-      const response = await chrome.tabs.sendMessage(tab.id, {{action: 'highlight{data_type.title()}'}});
+      const response = await chrome.tabs.sendMessage(tab.id, {{action: 'highlight{data_type_title}'}});
       if (response && response.count !== undefined) {{
         output.textContent = 'Found ' + response.count + ' {data_type}';
         status.textContent = 'Highlighting complete!';
@@ -544,10 +727,8 @@ document.addEventListener('DOMContentLoaded', function() {
     }}
   }});
 '''
-        
-        else:
-            # Generic action
-            action_code = '''  actionBtn.addEventListener('click', async () => {
+
+POPUP_JS_GENERIC = '''  actionBtn.addEventListener('click', async () => {
     try {
       const [tab] = await chrome.tabs.query({active: true, currentWindow: true});
       await chrome.tabs.sendMessage(tab.id, {action: 'execute'});
@@ -559,308 +740,48 @@ document.addEventListener('DOMContentLoaded', function() {
     }
   });
 '''
-        
-        return base_code + action_code + '});\n'
-    
-    def generate_content_js(self) -> str:
-        """Generate content.js file."""
-        features = self.analysis["features"]
-        color = self.analysis["color_scheme"] or "blue"
-        
-        base_code = '''// ChromeForge Generated Content Script
-(function() {
-  'use strict';
-  
-'''
-        
-        if features["highlight_phone"]:
-            specific_code = '''  // Phone number highlighting
-  const PHONE_REGEX = /(?:\\+?1[-.]?)?(?:\\(?\\d{3}\\)?[-.]?)?\\d{3}[-.]?\\d{4}\\b/g;
-  
-  function highlightPhones() {
-    const walker = document.createTreeWalker(
-      document.body,
-      NodeFilter.SHOW_TEXT,
-      null,
-      false
-    );
-    
-    const textNodes = [];
-    let node;
-    while (node = walker.nextNode()) {
-      if (node.nodeValue.match(PHONE_REGEX)) {
-        textNodes.push(node);
-      }
-    }
-    
-    let count = 0;
-    textNodes.forEach(textNode => {
-      const span = document.createElement('span');
-      span.innerHTML = textNode.nodeValue.replace(PHONE_REGEX, match => {
-        count++;
-        return '<mark class="cf-highlight cf-phone">' + match + '</mark>';
-      });
-      textNode.parentNode.replaceChild(span, textNode);
-    });
-    
-    return count;
-  }
-  
-  // Auto-run on page load
-  const phoneCount = highlightPhones();
-  console.log('ChromeForge: Found', phoneCount, 'phone numbers');
-'''
-        
-        elif features["highlight_email"]:
-            specific_code = '''  // Email address highlighting
-  const EMAIL_REGEX = /[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}/g;
-  
-  function highlightEmails() {
-    const walker = document.createTreeWalker(
-      document.body,
-      NodeFilter.SHOW_TEXT,
-      null,
-      false
-    );
-    
-    const textNodes = [];
-    let node;
-    while (node = walker.nextNode()) {
-      if (node.nodeValue.match(EMAIL_REGEX)) {
-        textNodes.push(node);
-      }
-    }
-    
-    let count = 0;
-    textNodes.forEach(textNode => {
-      const span = document.createElement('span');
-      span.innerHTML = textNode.nodeValue.replace(EMAIL_REGEX, match => {
-        count++;
-        return '<mark class="cf-highlight cf-email">' + match + '</mark>';
-      });
-      textNode.parentNode.replaceChild(span, textNode);
-    });
-    
-    return count;
-  }
-  
-  // Auto-run on page load
-  const emailCount = highlightEmails();
-  console.log('ChromeForge: Found', emailCount, 'email addresses');
-'''
-        
-        elif features["change_color"] or features["dark_mode"]:
-            target_color = color if isinstance(color, str) and color.startswith('#') else 'blue'
-            specific_code = f'''  // Page color modification
-  function changePageColor(color) {{
-    document.documentElement.style.setProperty('color', color, 'important');
-    document.body.style.setProperty('color', color, 'important');
-    
-    // Also apply to common text elements
-    const elements = document.querySelectorAll('p, span, div, h1, h2, h3, h4, h5, h6, a, li, td, th');
-    elements.forEach(el => {{
-      el.style.setProperty('color', color, 'important');
-    }});
-    
-    console.log('ChromeForge: Changed page color to', color);
-  }}
-'''
-        
-        else:
-            specific_code = '''  // Generic content script
-  console.log('ChromeForge: Content script loaded');
-  
-  function executeAction() {
-    console.log('ChromeForge: Executing action');
-    return { success: true };
-  }
-'''
-        
-        # Message listener for popup communication
-        message_handler = '''
-  // Message handler for popup communication
-  chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
-    console.log('ChromeForge: Received message', request);
-    
-    if (request.action === 'changeColor') {
-      changePageColor(request.color || 'blue');
-      sendResponse({success: true});
-    }
-    else if (request.action === 'highlightPhones') {
-      const count = typeof highlightPhones === 'function' ? highlightPhones() : 0;
-      sendResponse({success: true, count: count});
-    }
-    else if (request.action === 'highlightEmails') {
-      const count = typeof highlightEmails === 'function' ? highlightEmails() : 0;
-      sendResponse({success: true, count: count});
-    }
-    else if (request.action === 'execute') {
-      const result = typeof executeAction === 'function' ? executeAction() : {success: true};
-      sendResponse(result);
-    }
-    
-    return true; // Keep message channel open for async response
-  });
-'''
-        
-        # Add changePageColor function if not already present
-        if 'changePageColor' not in specific_code:
-            specific_code += '''
-  function changePageColor(color) {
-    document.documentElement.style.setProperty('color', color, 'important');
-    document.body.style.setProperty('color', color, 'important');
-  }
-'''
-        
-        return base_code + specific_code + message_handler + '\n})();\n'
-    
-    def generate_background_js(self) -> str:
-        """Generate background.js service worker."""
-        features = self.analysis["features"]
-        blocked_sites = self.analysis["blocked_sites"]
-        
-        base_code = '''// ChromeForge Generated Background Service Worker
-console.log('ChromeForge: Background service worker starting');
-
-// Installation handler
-chrome.runtime.onInstalled.addListener((details) => {
-  console.log('ChromeForge: Extension installed', details.reason);
-});
 
-// Startup handler
-chrome.runtime.onStartup.addListener(() => {
-  console.log('ChromeForge: Browser started with extension');
-});
-
-'''
-        
-        if features["block_sites"] and blocked_sites:
-            sites_list = ', '.join([f'"{s}"' for s in blocked_sites])
-            block_code = f'''// Site blocking configuration
-const BLOCKED_SITES = [{sites_list}];
+# content.js action function -> the message action that triggers it
+_CONTENT_ACTIONS = {
+    "highlightPhones": "highlightPhones",
+    "highlightEmails": "highlightEmails",
+    "changePageColor": "changeColor",
+    "executeAction": "execute",
+}
 
-// Dynamic rule creation for blocking
-async function setupBlockingRules() {{
-  const rules = BLOCKED_SITES.map((site, index) => ({{
-    id: index + 1,
-    priority: 1,
-    action: {{ type: 'block' }},
-    condition: {{
-      urlFilter: '*://*.' + site + '/*',
-      resourceTypes: ['main_frame', 'sub_frame']
-    }}
-  }}));
-  
-  try {{
-    // Remove old rules first
-    const oldRules = await chrome.declarativeNetRequest.getDynamicRules();
-    const oldRuleIds = oldRules.map(rule => rule.id);
-    
-    await chrome.declarativeNetRequest.updateDynamicRules({{
-      removeRuleIds: oldRuleIds,
-      addRules: rules
-    }});
-    
-    console.log('ChromeForge: Blocking rules installed for', BLOCKED_SITES);
-  }} catch (error) {{
-    console.error('ChromeForge: Error setting up blocking rules', error);
-  }}
-}}
+CONTENT_COLOR_HANDLER = '''    changeColor: (request) => {
+      changePageColor(request.color || 'blue');
+      return {success: true};
+    }'''
 
-// Setup blocking on install
-chrome.runtime.onInstalled.addListener(setupBlockingRules);
-chrome.runtime.onStartup.addListener(setupBlockingRules);
+# Stylesheet shared by every generated extension; it does not depend on the
+# analysis, so it is built once rather than per CodeGenerator
+STYLES_CSS = '''/* ChromeForge CYBERPUNK Edition */
+@import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700;900&family=Rajdhani:wght@400;500;600;700&display=swap');
 
-'''
-            base_code += block_code
-            
-            # Time-based blocking
-            if features["time_based"]:
-                time_code = '''
-// Time-based blocking (work hours: 9 AM - 5 PM)
-function isWorkHours() {
-  const now = new Date();
-  const hour = now.getHours();
-  return hour >= 9 && hour < 17;
+/* CSS Variables for Cyberpunk Theme */
+:root {
+  --neon-cyan: #00ffff;
+  --neon-pink: #ff00ff;
+  --neon-purple: #bf00ff;
+  --neon-blue: #00bfff;
+  --neon-green: #00ff00;
+  --dark-bg: #0a0a0f;
+  --darker-bg: #050508;
+  --glass-bg: rgba(10, 10, 20, 0.85);
+  --border-glow: rgba(0, 255, 255, 0.3);
+  --text-primary: #ffffff;
+  --text-secondary: #a0a0b0;
 }
 
-// Check and update blocking based on time
-async function updateTimeBasedBlocking() {
-  if (isWorkHours()) {
-    await setupBlockingRules();
-    console.log('ChromeForge: Work hours - blocking enabled');
-  } else {
-    // Remove all blocking rules outside work hours
-    const oldRules = await chrome.declarativeNetRequest.getDynamicRules();
-    const oldRuleIds = oldRules.map(rule => rule.id);
-    await chrome.declarativeNetRequest.updateDynamicRules({
-      removeRuleIds: oldRuleIds,
-      addRules: []
-    });
-    console.log('ChromeForge: Outside work hours - blocking disabled');
-  }
-}
-
-// Check every minute
-chrome.alarms.create('checkWorkHours', { periodInMinutes: 1 });
-chrome.alarms.onAlarm.addListener((alarm) => {
-  if (alarm.name === 'checkWorkHours') {
-    updateTimeBasedBlocking();
-  }
-});
-
-// Initial check
-updateTimeBasedBlocking();
-'''
-                base_code += time_code
-        
-        elif features["time_based"]:
-            # Generic alarm/timer functionality
-            timer_code = '''
-// Periodic alarm setup
-chrome.alarms.create('periodicTask', { periodInMinutes: 1 });
-
-chrome.alarms.onAlarm.addListener((alarm) => {
-  if (alarm.name === 'periodicTask') {
-    console.log('ChromeForge: Periodic task executed at', new Date().toISOString());
-    // Add your periodic task logic here
-  }
-});
-'''
-            base_code += timer_code
-        
-        return base_code
-    
-    def generate_styles_css(self) -> str:
-        """Generate CYBERPUNK styles.css file."""
-        color = self.analysis["color_scheme"] or "#00ffff"
-        
-        css = f'''/* ChromeForge CYBERPUNK Edition */
-@import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700;900&family=Rajdhani:wght@400;500;600;700&display=swap');
-
-/* CSS Variables for Cyberpunk Theme */
-:root {{
-  --neon-cyan: #00ffff;
-  --neon-pink: #ff00ff;
-  --neon-purple: #bf00ff;
-  --neon-blue: #00bfff;
-  --neon-green: #00ff00;
-  --dark-bg: #0a0a0f;
-  --darker-bg: #050508;
-  --glass-bg: rgba(10, 10, 20, 0.85);
-  --border-glow: rgba(0, 255, 255, 0.3);
-  --text-primary: #ffffff;
-  --text-secondary: #a0a0b0;
-}}
-
 /* Popup Styles */
-* {{
+* {
   margin: 0;
   padding: 0;
   box-sizing: border-box;
-}}
+}
 
-body {{
+body {
   font-family: 'Rajdhani', 'Segoe UI', sans-serif;
   font-size: 14px;
   color: var(--text-primary);
@@ -868,10 +789,10 @@ body {{
   min-height: 100%;
   position: relative;
   overflow: hidden;
-}}
+}
 
 /* Animated background grid */
-body::before {{
+body::before {
   content: '';
   position: fixed;
   top: 0;
@@ -884,10 +805,10 @@ body::before {{
   background-size: 20px 20px;
   pointer-events: none;
   z-index: 0;
-}}
+}
 
 /* Glowing orb effect */
-body::after {{
+body::after {
   content: '';
   position: fixed;
   top: -50%;
@@ -899,14 +820,14 @@ body::after {{
   pointer-events: none;
   z-index: 0;
   animation: pulse 8s ease-in-out infinite;
-}}
+}
 
-@keyframes pulse {{
-  0%, 100% {{ opacity: 0.5; transform: scale(1); }}
-  50% {{ opacity: 0.8; transform: scale(1.1); }}
-}}
+@keyframes pulse {
+  0%, 100% { opacity: 0.5; transform: scale(1); }
+  50% { opacity: 0.8; transform: scale(1.1); }
+}
 
-.popup-container {{
+.popup-container {
   position: relative;
   z-index: 1;
   min-width: 320px;
@@ -920,35 +841,35 @@ body::after {{
     0 0 30px rgba(0, 255, 255, 0.15),
     0 0 60px rgba(255, 0, 255, 0.1),
     inset 0 1px 0 rgba(255, 255, 255, 0.1);
-}}
+}
 
 /* Corner accents */
 .popup-container::before,
-.popup-container::after {{
+.popup-container::after {
   content: '';
   position: absolute;
   width: 30px;
   height: 30px;
   border: 2px solid var(--neon-cyan);
-}}
+}
 
-.popup-container::before {{
+.popup-container::before {
   top: -2px;
   left: -2px;
   border-right: none;
   border-bottom: none;
   border-radius: 16px 0 0 0;
-}}
+}
 
-.popup-container::after {{
+.popup-container::after {
   bottom: -2px;
   right: -2px;
   border-left: none;
   border-top: none;
   border-radius: 0 0 16px 0;
-}}
+}
 
-.popup-title {{
+.popup-title {
   font-family: 'Orbitron', sans-serif;
   font-size: 20px;
   font-weight: 700;
@@ -963,14 +884,14 @@ body::after {{
   background-clip: text;
   animation: shimmer 3s linear infinite;
   text-shadow: 0 0 30px rgba(0, 255, 255, 0.5);
-}}
+}
 
-@keyframes shimmer {{
-  0% {{ background-position: 0% center; }}
-  100% {{ background-position: 200% center; }}
-}}
+@keyframes shimmer {
+  0% { background-position: 0% center; }
+  100% { background-position: 200% center; }
+}
 
-.output-area {{
+.output-area {
   min-height: 60px;
   padding: 16px;
   margin-bottom: 16px;
@@ -984,9 +905,9 @@ body::after {{
   color: var(--neon-cyan);
   position: relative;
   overflow: hidden;
-}}
+}
 
-.output-area::before {{
+.output-area::before {
   content: '';
   position: absolute;
   top: 0;
@@ -995,14 +916,14 @@ body::after {{
   height: 100%;
   background: linear-gradient(90deg, transparent, rgba(0, 255, 255, 0.1), transparent);
   animation: scan 3s linear infinite;
-}}
+}
 
-@keyframes scan {{
-  0% {{ left: -100%; }}
-  100% {{ left: 100%; }}
-}}
+@keyframes scan {
+  0% { left: -100%; }
+  100% { left: 100%; }
+}
 
-.btn-primary {{
+.btn-primary {
   width: 100%;
   padding: 14px 24px;
   border: none;
@@ -1022,9 +943,9 @@ body::after {{
     0 0 20px rgba(0, 255, 255, 0.4),
     0 0 40px rgba(0, 255, 255, 0.2),
     inset 0 1px 0 rgba(255, 255, 255, 0.3);
-}}
+}
 
-.btn-primary::before {{
+.btn-primary::before {
   content: '';
   position: absolute;
   top: 0;
@@ -1033,25 +954,25 @@ body::after {{
   height: 100%;
   background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.4), transparent);
   transition: left 0.5s ease;
-}}
+}
 
-.btn-primary:hover {{
+.btn-primary:hover {
   transform: translateY(-2px) scale(1.02);
   box-shadow: 
     0 0 30px rgba(0, 255, 255, 0.6),
     0 0 60px rgba(255, 0, 255, 0.3),
     inset 0 1px 0 rgba(255, 255, 255, 0.4);
-}}
+}
 
-.btn-primary:hover::before {{
+.btn-primary:hover::before {
   left: 100%;
-}}
+}
 
-.btn-primary:active {{
+.btn-primary:active {
   transform: translateY(0) scale(0.98);
-}}
+}
 
-.status-message {{
+.status-message {
   margin-top: 16px;
   padding: 12px;
   border-radius: 8px;
@@ -1062,70 +983,475 @@ body::after {{
   text-transform: uppercase;
   letter-spacing: 1px;
   border: 1px solid transparent;
-}}
+}
 
-.status-message.success {{
+.status-message.success {
   background: rgba(0, 255, 0, 0.1);
   border-color: rgba(0, 255, 0, 0.3);
   color: var(--neon-green);
   box-shadow: 0 0 20px rgba(0, 255, 0, 0.2);
-}}
+}
 
-.status-message.error {{
+.status-message.error {
   background: rgba(255, 0, 100, 0.1);
   border-color: rgba(255, 0, 100, 0.3);
   color: #ff0064;
   box-shadow: 0 0 20px rgba(255, 0, 100, 0.2);
-}}
+}
 
-.date-display {{
+.date-display {
   font-family: 'Orbitron', sans-serif;
   font-size: 18px;
   font-weight: 500;
   text-align: center;
   color: var(--neon-cyan);
   text-shadow: 0 0 10px rgba(0, 255, 255, 0.5);
-}}
+}
 
 /* Content Script Styles - CYBERPUNK */
-.cf-highlight {{
+.cf-highlight {
   padding: 3px 8px;
   border-radius: 4px;
   font-weight: 600;
   position: relative;
   animation: neon-pulse 2s ease-in-out infinite;
-}}
+}
 
-@keyframes neon-pulse {{
-  0%, 100% {{ opacity: 1; }}
-  50% {{ opacity: 0.8; }}
-}}
+@keyframes neon-pulse {
+  0%, 100% { opacity: 1; }
+  50% { opacity: 0.8; }
+}
 
-.cf-phone {{
+.cf-phone {
   background: linear-gradient(135deg, rgba(0, 255, 255, 0.2), rgba(0, 191, 255, 0.2));
   border: 1px solid rgba(0, 255, 255, 0.5);
   color: #00ffff !important;
   box-shadow: 0 0 10px rgba(0, 255, 255, 0.3), inset 0 0 10px rgba(0, 255, 255, 0.1);
   text-shadow: 0 0 5px rgba(0, 255, 255, 0.5);
-}}
+}
 
-.cf-email {{
+.cf-email {
   background: linear-gradient(135deg, rgba(255, 0, 255, 0.2), rgba(191, 0, 255, 0.2));
   border: 1px solid rgba(255, 0, 255, 0.5);
   color: #ff00ff !important;
   box-shadow: 0 0 10px rgba(255, 0, 255, 0.3), inset 0 0 10px rgba(255, 0, 255, 0.1);
   text-shadow: 0 0 5px rgba(255, 0, 255, 0.5);
-}}
+}
 
-.cf-link {{
+.cf-link {
   background: linear-gradient(135deg, rgba(0, 255, 0, 0.2), rgba(0, 191, 0, 0.2));
   border: 1px solid rgba(0, 255, 0, 0.5);
   color: #00ff00 !important;
   box-shadow: 0 0 10px rgba(0, 255, 0, 0.3), inset 0 0 10px rgba(0, 255, 0, 0.1);
   text-shadow: 0 0 5px rgba(0, 255, 0, 0.5);
+}
+'''
+
+
+class CodeGenerator:
+    """Generate extension code files based on analysis."""
+    
+    __slots__ = ("analysis", "files")
+    
+    def __init__(self, analysis: Dict[str, Any]):
+        self.analysis = analysis
+        self.files = {}
+    
+    def _blocked_sites_regex(self) -> str:
+        """Build one declarativeNetRequest regexFilter covering every blocked site."""
+        sites = '|'.join(re.escape(site) for site in self.analysis["blocked_sites"])
+        return f"^https?://([^/]+\\.)?({sites})[:/]"
+    
+    def _popup_action(self) -> Optional[str]:
+        """The message action popup.js sends to the content script, if any.
+
+        generate_popup_js and generate_content_js both branch on this, so the
+        action sent and the handler registered cannot drift apart.
+        """
+        features = self.analysis["features"]
+        if features["show_date"]:
+            return None
+        if features["change_color"] or "blue" in self.analysis["normalized_prompt"]:
+            return "changeColor"
+        if features["highlight_phone"]:
+            return "highlightPhones"
+        if features["highlight_email"]:
+            return "highlightEmails"
+        return "execute"
+    
+    def generate_popup_html(self) -> str:
+        """Generate popup.html file."""
+        features = self.analysis["features"]
+        
+        title, button_text = next(
+            ((title, button) for feature, title, button in POPUP_LABELS if features[feature]),
+            DEFAULT_POPUP_LABELS
+        )
+        
+        return POPUP_HTML_TEMPLATE.format(title=title, button_text=button_text)
+    
+    def generate_popup_js(self) -> str:
+        """Generate popup.js file."""
+        features = self.analysis["features"]
+        action = self._popup_action()
+        
+        if action is None:
+            # Date/time display with optional refresh
+            action_code = POPUP_JS_DATE
+            if features["refresh_timer"]:
+                action_code += POPUP_JS_DATE_REFRESH
+            action_code += POPUP_JS_DATE_BUTTON
+        
+        elif action == "changeColor":
+            action_code = POPUP_JS_CHANGE_COLOR
+        
+        elif action in ("highlightPhones", "highlightEmails"):
+            data_type = "phones" if action == "highlightPhones" else "emails"
+            action_code = POPUP_JS_HIGHLIGHT_TEMPLATE.format(data_type=data_type,
+                                                             data_type_title=data_type.title())
+        
+        else:
+            # Generic action
+            action_code = POPUP_JS_GENERIC
+        
+        return POPUP_JS_HEADER + action_code + '});\n'
+    
+    def generate_content_js(self) -> str:
+        """Generate content.js file."""
+        features = self.analysis["features"]
+        color = self.analysis["color_scheme"] or "blue"
+        
+        base_code = '''// ChromeForge Generated Content Script
+(function() {
+  'use strict';
+  
+'''
+        
+        # The action function each branch defines, if any
+        action_fn = None
+        
+        if features["highlight_phone"]:
+            action_fn = "highlightPhones"
+            specific_code = '''  // Phone number highlighting
+  const PHONE_REGEX = /(?:\\+?1[-.]?)?(?:\\(?\\d{3}\\)?[-.]?)?\\d{3}[-.]?\\d{4}\\b/g;
+  
+  function highlightPhones() {
+    // Walk the DOM via firstChild/nextSibling; cheaper than a TreeWalker
+    const root = document.body;
+    const textNodes = [];
+    let node = root.firstChild;
+    while (node) {
+      if (node.nodeType === Node.TEXT_NODE) {
+        // test() only needs the first match; reset the /g cursor between nodes
+        PHONE_REGEX.lastIndex = 0;
+        if (PHONE_REGEX.test(node.nodeValue)) {
+          textNodes.push(node);
+        }
+      }
+      
+      if (node.firstChild) {
+        node = node.firstChild;
+      } else {
+        while (node !== root && !node.nextSibling) {
+          node = node.parentNode;
+        }
+        node = node === root ? null : node.nextSibling;
+      }
+    }
+    
+    // Build the markup now so the count is exact; defer the DOM writes
+    let count = 0;
+    const replacements = textNodes.map(textNode => [
+      textNode,
+      textNode.nodeValue.replace(PHONE_REGEX, match => {
+        count++;
+        return '<mark class="cf-highlight cf-phone">' + match + '</mark>';
+      })
+    ]);
+    
+    applyHighlights(replacements);
+    return count;
+  }
+  
+  // Auto-run on page load
+  const phoneCount = highlightPhones();
+  console.log('ChromeForge: Found', phoneCount, 'phone numbers');
+'''
+        
+        elif features["highlight_email"]:
+            action_fn = "highlightEmails"
+            specific_code = '''  // Email address highlighting
+  const EMAIL_REGEX = /[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}/g;
+  
+  function highlightEmails() {
+    // Walk the DOM via firstChild/nextSibling; cheaper than a TreeWalker
+    const root = document.body;
+    const textNodes = [];
+    let node = root.firstChild;
+    while (node) {
+      if (node.nodeType === Node.TEXT_NODE) {
+        // test() only needs the first match; reset the /g cursor between nodes
+        EMAIL_REGEX.lastIndex = 0;
+        if (EMAIL_REGEX.test(node.nodeValue)) {
+          textNodes.push(node);
+        }
+      }
+      
+      if (node.firstChild) {
+        node = node.firstChild;
+      } else {
+        while (node !== root && !node.nextSibling) {
+          node = node.parentNode;
+        }
+        node = node === root ? null : node.nextSibling;
+      }
+    }
+    
+    // Build the markup now so the count is exact; defer the DOM writes
+    let count = 0;
+    const replacements = textNodes.map(textNode => [
+      textNode,
+      textNode.nodeValue.replace(EMAIL_REGEX, match => {
+        count++;
+        return '<mark class="cf-highlight cf-email">' + match + '</mark>';
+      })
+    ]);
+    
+    applyHighlights(replacements);
+    return count;
+  }
+  
+  // Auto-run on page load
+  const emailCount = highlightEmails();
+  console.log('ChromeForge: Found', emailCount, 'email addresses');
+'''
+        
+        elif features["change_color"] or features["dark_mode"]:
+            action_fn = "changePageColor"
+            target_color = color if isinstance(color, str) and color.startswith('#') else 'blue'
+            specific_code = f'''  // Page color modification
+  // One injected rule instead of an inline style write per element;
+  // reused on later calls so rules don't accumulate
+  function changePageColor(color) {{
+    let style = document.getElementById('cf-color-override');
+    if (!style) {{
+      style = document.createElement('style');
+      style.id = 'cf-color-override';
+      (document.head || document.documentElement).appendChild(style);
+    }}
+    style.textContent = 'html, body, p, span, div, h1, h2, h3, h4, h5, h6, a, li, td, th ' +
+      '{{ color: ' + color + ' !important; }}';
+    
+    console.log('ChromeForge: Changed page color to', color);
+  }}
+'''
+        
+        else:
+            action_fn = "executeAction"
+            specific_code = '''  // Generic content script
+  console.log('ChromeForge: Content script loaded');
+  
+  function executeAction() {
+    console.log('ChromeForge: Executing action');
+    return { success: true };
+  }
+'''
+        
+        # Message handlers keyed by action, specialized at generation time:
+        # only this script's own action and the one popup.js sends are wired
+        # up, and an action whose function isn't defined here answers with
+        # its default result
+        popup_action = self._popup_action() if self.analysis["components"]["popup"] else None
+        actions = {_CONTENT_ACTIONS[action_fn], popup_action}
+        handlers = []
+        if "changeColor" in actions:
+            handlers.append(CONTENT_COLOR_HANDLER)
+        if "highlightPhones" in actions:
+            phones_count = "highlightPhones()" if action_fn == "highlightPhones" else "0"
+            handlers.append(f"    highlightPhones: () => ({{success: true, count: {phones_count}}})")
+        if "highlightEmails" in actions:
+            emails_count = "highlightEmails()" if action_fn == "highlightEmails" else "0"
+            handlers.append(f"    highlightEmails: () => ({{success: true, count: {emails_count}}})")
+        if "execute" in actions:
+            execute_result = "executeAction()" if action_fn == "executeAction" else "({success: true})"
+            handlers.append(f"    execute: () => {execute_result}")
+        handler_entries = ",\n".join(handlers)
+        message_handler = f'''
+  // Message handlers for popup communication (null prototype, so only
+  // these actions resolve; anything else gets an error reply)
+  const MESSAGE_HANDLERS = {{
+    __proto__: null,
+{handler_entries}
+  }};
+  
+  chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {{
+    console.log('ChromeForge: Received message', request);
+    
+    const handler = MESSAGE_HANDLERS[request.action];
+    sendResponse(handler ? handler(request)
+                         : {{success: false, error: 'Unknown action: ' + request.action}});
+  }});
+'''
+        
+        # Shared frame-batched DOM writer for the highlighters
+        if features["highlight_phone"] or features["highlight_email"]:
+            specific_code += '''
+  // Swap text nodes for highlighted markup inside animation frames,
+  // batchSize nodes per frame, so style and layout run once per batch
+  // instead of once per match
+  function applyHighlights(replacements, start = 0, batchSize = 20) {
+    requestAnimationFrame(() => {
+      const end = Math.min(start + batchSize, replacements.length);
+      for (let i = start; i < end; i++) {
+        const [textNode, html] = replacements[i];
+        if (!textNode.parentNode) continue;
+        const span = document.createElement('span');
+        span.innerHTML = html;
+        textNode.parentNode.replaceChild(span, textNode);
+      }
+      if (end < replacements.length) {
+        applyHighlights(replacements, end, batchSize);
+      }
+    });
+  }
+'''
+        
+        # The popup can ask for a color change even when this script's own
+        # action is something else
+        if popup_action == "changeColor" and action_fn != "changePageColor":
+            specific_code += '''
+  function changePageColor(color) {
+    document.documentElement.style.setProperty('color', color, 'important');
+    document.body.style.setProperty('color', color, 'important');
+  }
+'''
+        
+        return base_code + specific_code + message_handler + '\n})();\n'
+    
+    def generate_background_js(self) -> str:
+        """Generate background.js service worker."""
+        features = self.analysis["features"]
+        blocked_sites = self.analysis["blocked_sites"]
+        
+        base_code = '''// ChromeForge Generated Background Service Worker
+console.log('ChromeForge: Background service worker starting');
+
+// Installation handler
+chrome.runtime.onInstalled.addListener((details) => {
+  console.log('ChromeForge: Extension installed', details.reason);
+});
+
+// Startup handler
+chrome.runtime.onStartup.addListener(() => {
+  console.log('ChromeForge: Browser started with extension');
+});
+
+'''
+        
+        if features["block_sites"] and blocked_sites:
+            sites_list = ', '.join([f'"{s}"' for s in blocked_sites])
+            block_pattern = json.dumps(self._blocked_sites_regex())
+            block_code = f'''// Site blocking configuration
+const BLOCKED_SITES = [{sites_list}];
+
+// All sites share one regex rule, so the matcher checks a single pattern
+const BLOCK_PATTERN = {block_pattern};
+
+// Dynamic rule creation for blocking
+async function setupBlockingRules() {{
+  const rules = [{{
+    id: 1,
+    priority: 1,
+    action: {{ type: 'block' }},
+    condition: {{
+      regexFilter: BLOCK_PATTERN,
+      resourceTypes: ['main_frame', 'sub_frame']
+    }}
+  }}];
+  
+  try {{
+    // Remove old rules first
+    const oldRules = await chrome.declarativeNetRequest.getDynamicRules();
+    const oldRuleIds = oldRules.map(rule => rule.id);
+    
+    await chrome.declarativeNetRequest.updateDynamicRules({{
+      removeRuleIds: oldRuleIds,
+      addRules: rules
+    }});
+    
+    console.log('ChromeForge: Blocking rules installed for', BLOCKED_SITES);
+  }} catch (error) {{
+    console.error('ChromeForge: Error setting up blocking rules', error);
+  }}
 }}
+
+// Setup blocking on install
+chrome.runtime.onInstalled.addListener(setupBlockingRules);
+chrome.runtime.onStartup.addListener(setupBlockingRules);
+
+'''
+            base_code += block_code
+            
+            # Time-based blocking
+            if features["time_based"]:
+                time_code = '''
+// Time-based blocking (work hours: 9 AM - 5 PM)
+function isWorkHours() {
+  const now = new Date();
+  const hour = now.getHours();
+  return hour >= 9 && hour < 17;
+}
+
+// Check and update blocking based on time
+async function updateTimeBasedBlocking() {
+  if (isWorkHours()) {
+    await setupBlockingRules();
+    console.log('ChromeForge: Work hours - blocking enabled');
+  } else {
+    // Remove all blocking rules outside work hours
+    const oldRules = await chrome.declarativeNetRequest.getDynamicRules();
+    const oldRuleIds = oldRules.map(rule => rule.id);
+    await chrome.declarativeNetRequest.updateDynamicRules({
+      removeRuleIds: oldRuleIds,
+      addRules: []
+    });
+    console.log('ChromeForge: Outside work hours - blocking disabled');
+  }
+}
+
+// Check every minute
+chrome.alarms.create('checkWorkHours', { periodInMinutes: 1 });
+chrome.alarms.onAlarm.addListener((alarm) => {
+  if (alarm.name === 'checkWorkHours') {
+    updateTimeBasedBlocking();
+  }
+});
+
+// Initial check
+updateTimeBasedBlocking();
 '''
-        return css
+                base_code += time_code
+        
+        elif features["time_based"]:
+            # Generic alarm/timer functionality
+            timer_code = '''
+// Periodic alarm setup
+chrome.alarms.create('periodicTask', { periodInMinutes: 1 });
+
+chrome.alarms.onAlarm.addListener((alarm) => {
+  if (alarm.name === 'periodicTask') {
+    console.log('ChromeForge: Periodic task executed at', new Date().toISOString());
+    // Add your periodic task logic here
+  }
+});
+'''
+            base_code += timer_code
+        
+        return base_code
+    
+    def generate_styles_css(self) -> str:
+        """Generate CYBERPUNK styles.css file."""
+        return STYLES_CSS
     
     def generate_rules_json(self) -> str:
         """Generate declarativeNetRequest rules.json for blocking."""
@@ -1134,19 +1460,17 @@ body::after {{
         if not blocked_sites:
             return "[]"
         
-        rules = []
-        for i, site in enumerate(blocked_sites, start=1):
-            rules.append({
-                "id": i,
-                "priority": 1,
-                "action": {"type": "block"},
-                "condition": {
-                    "urlFilter": f"||{site}",
-                    "resourceTypes": ["main_frame", "sub_frame"]
-                }
-            })
+        rules = [{
+            "id": 1,
+            "priority": 1,
+            "action": {"type": "block"},
+            "condition": {
+                "regexFilter": self._blocked_sites_regex(),
+                "resourceTypes": ["main_frame", "sub_frame"]
+            }
+        }]
         
-        return json.dumps(rules, indent=2)
+        return _JSON_ENCODER.encode(rules)
     
     def generate_all(self) -> Dict[str, str]:
         """Generate all required files."""
@@ -1182,6 +1506,8 @@ class FileSystemManager:
         self.output_dir = output_dir
         self.backup_dir = output_dir.parent / BACKUP_DIR_NAME
         self.files_written = []
+        # The manifest as last written, so validation needn't re-read it
+        self.manifest: Optional[Dict[str, Any]] = None
     
     def prepare_directory(self) -> bool:
         """Prepare output directory, backing up if exists."""
@@ -1189,8 +1515,11 @@ class FileSystemManager:
             if self.output_dir.exists():
                 # Backup existing
                 if self.backup_dir.exists():
+                    # Only needed on re-runs, so not imported at startup
+                    import shutil
                     shutil.rmtree(self.backup_dir)
-                shutil.move(str(self.output_dir), str(self.backup_dir))
+                # Sibling directories, so this is a same-filesystem rename
+                os.rename(self.output_dir, self.backup_dir)
                 print(f"  -> Existing extension backed up to {BACKUP_DIR_NAME}/")
             
             self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -1203,7 +1532,15 @@ class FileSystemManager:
         """Write a file to the output directory."""
         try:
             filepath = self.output_dir / filename
-            filepath.write_text(content, encoding='utf-8')
+            # Encode once and write the bytes straight to the descriptor,
+            # skipping the TextIOWrapper layer for these small files
+            data = memoryview(content.encode('utf-8'))
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
             self.files_written.append(filename)
             return True
         except Exception as e:
@@ -1213,8 +1550,11 @@ class FileSystemManager:
     def write_manifest(self, manifest: Dict[str, Any]) -> bool:
         """Write manifest.json with proper formatting."""
         try:
-            content = json.dumps(manifest, indent=2, ensure_ascii=False)
-            return self.write_file("manifest.json", content)
+            content = _JSON_ENCODER.encode(manifest)
+            if not self.write_file("manifest.json", content):
+                return False
+            self.manifest = manifest
+            return True
         except Exception as e:
             print(f"  X Error writing manifest.json: {e}")
             return False
@@ -1238,15 +1578,29 @@ class FileSystemManager:
         """Validate the generated extension structure."""
         errors = []
         
+        # One directory read instead of a stat per referenced file; nested
+        # paths fall back to an exists() check
+        try:
+            with os.scandir(self.output_dir) as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
+            present = set()
+        
+        def file_exists(name: str) -> bool:
+            return name in present or (self.output_dir / name).exists()
+        
         # Check manifest exists
         manifest_path = self.output_dir / "manifest.json"
-        if not manifest_path.exists():
+        if "manifest.json" not in present:
             errors.append("manifest.json not found")
         else:
             # Validate JSON
             try:
-                with open(manifest_path, 'r') as f:
-                    manifest = json.load(f)
+                manifest = self.manifest
+                if manifest is None:
+                    # Parse the raw bytes: json detects UTF-8 itself, so the
+                    # result doesn't depend on the locale's default encoding
+                    manifest = json.loads(manifest_path.read_bytes())
                 
                 # Check MV3
                 if manifest.get("manifest_version") != 3:
@@ -1254,22 +1608,20 @@ class FileSystemManager:
                 
                 # Check referenced files exist
                 if "action" in manifest and "default_popup" in manifest["action"]:
-                    popup_file = self.output_dir / manifest["action"]["default_popup"]
-                    if not popup_file.exists():
+                    if not file_exists(manifest["action"]["default_popup"]):
                         errors.append(f"Referenced popup file not found: {manifest['action']['default_popup']}")
                 
                 if "background" in manifest and "service_worker" in manifest["background"]:
-                    bg_file = self.output_dir / manifest["background"]["service_worker"]
-                    if not bg_file.exists():
+                    if not file_exists(manifest["background"]["service_worker"]):
                         errors.append(f"Referenced background file not found: {manifest['background']['service_worker']}")
                 
                 if "content_scripts" in manifest:
                     for cs in manifest["content_scripts"]:
                         for js_file in cs.get("js", []):
-                            if not (self.output_dir / js_file).exists():
+                            if not file_exists(js_file):
                                 errors.append(f"Referenced content script not found: {js_file}")
                 
-            except json.JSONDecodeError as e:
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
                 errors.append(f"Invalid JSON in manifest.json: {e}")
         
         return len(errors) == 0, errors
@@ -1283,8 +1635,6 @@ class FileSystemManager:
 # MAIN ORCHESTRATOR - CYBERPUNK EDITION 🌆
 # ============================================================================
 
-import time
-
 # ANSI color codes + 256 color support for gradients
 class Colors:
     # Basic colors
@@ -1313,44 +1663,128 @@ class Colors:
     WHITE = '\033[97m'
     GRAY = '\033[90m'
     
+    # Compound styles, one escape sequence each
+    BOLD_WHITE = '\033[1;97m'
+    BOLD_CYAN = '\033[1;38;5;51m'
+    
     # Gradient helpers
     @staticmethod
     def gradient_text(text, colors):
-        """Apply gradient colors to text."""
-        result = ""
+        """Apply gradient colors to text.
+
+        A color code is only emitted where it differs from the previous
+        character's, so repeated entries in ``colors`` cost no extra bytes.
+        """
+        parts = []
+        append = parts.append
+        current = None
         color_count = len(colors)
         for i, char in enumerate(text):
             color = colors[i % color_count]
-            result += f"{color}{char}"
-        return result + Colors.RESET
+            if color != current:
+                append(color)
+                current = color
+            append(char)
+        parts.append(Colors.RESET)
+        return "".join(parts)
     
     @staticmethod
     def rgb(r, g, b):
         """Generate 24-bit color code."""
-        return f'\033[38;2;{r};{g};{b}m'
+        return f'\033[38;2;{r};{g};{b}m' if Colors.enabled else ''
     
     @staticmethod
     def bg_rgb(r, g, b):
         """Generate 24-bit background color code."""
-        return f'\033[48;2;{r};{g};{b}m'
+        return f'\033[48;2;{r};{g};{b}m' if Colors.enabled else ''
+    
+    # Escape codes are live until disable(); enable() puts them back
+    enabled = True
+    _codes: Dict[str, str] = {}
+    
+    @classmethod
+    def disable(cls):
+        """Blank every escape code so output is plain text."""
+        if not cls.enabled:
+            return
+        cls._codes = {name: value for name, value in vars(cls).items()
+                      if name.isupper() and isinstance(value, str)}
+        for name in cls._codes:
+            setattr(cls, name, '')
+        cls.enabled = False
+    
+    @classmethod
+    def enable(cls):
+        """Restore the escape codes blanked by disable()."""
+        if cls.enabled:
+            return
+        for name, value in cls._codes.items():
+            setattr(cls, name, value)
+        cls.enabled = True
+
+
+def _stdout_is_tty() -> bool:
+    """True when stdout is an interactive terminal."""
+    isatty = getattr(sys.stdout, 'isatty', None)
+    return bool(isatty and isatty())
+
+
+def _color_enabled() -> bool:
+    """Use color only on an interactive terminal, and never under NO_COLOR."""
+    if os.environ.get('NO_COLOR'):
+        return False
+    return _stdout_is_tty()
+
+
+def _enable_windows_ansi() -> bool:
+    """Switch the Windows console to VT mode so it understands ANSI escapes."""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+
+# Home the cursor, clear the screen and the scrollback, as `clear` does
+_CLEAR_SCREEN = '\033[H\033[2J\033[3J'
+
+
+@lru_cache(maxsize=1)
+def _ansi_clear() -> bool:
+    """True if the console takes ANSI escapes; asked on the first clear only."""
+    return os.name != 'nt' or _enable_windows_ansi()
 
 
 def clear_screen():
     """Clear terminal screen."""
-    os.system('clear' if os.name != 'nt' else 'cls')
+    # Pipes and log files get no escape codes, same as for color
+    if not _stdout_is_tty():
+        return
+    if _ansi_clear():
+        print(_CLEAR_SCREEN, end='')
+    else:
+        sys.stdout.flush()
+        os.system('cls')
 
 
-def print_cyberpunk_banner():
-    """Print epic cyberpunk animated banner with gradients."""
-    clear_screen()
-    
+# Static screens below are rendered on first use, once per color mode, since
+# main() only settles Colors at run time
+@lru_cache(maxsize=2)
+def _render_banner(color: bool) -> str:
+    """Render the banner art; it has no dynamic parts, so this runs once per color mode."""
     # Gradient colors for the logo
     pink = Colors.NEON_PINK
     cyan = Colors.NEON_CYAN
     purple = Colors.NEON_PURPLE
     
     # Epic ASCII art with color gradient
-    print(f"""
+    return f"""
 {pink}   ╔══════════════════════════════════════════════════════════════╗
    ║                                                              ║
    ║{cyan}  ░█████╗░██╗░░██╗██████╗░░█████╗░███╗░░░███╗███████╗         {pink}║
@@ -1372,141 +1806,256 @@ def print_cyberpunk_banner():
    ║  {Colors.NEON_CYAN}🌐{pink} {Colors.GRAY}FAST University Tech Society{Colors.RESET}              {pink}║
    ║  {Colors.NEON_GREEN}📦{pink} {Colors.GRAY}Version {VERSION} │ Pure Python │ No APIs{Colors.RESET}          {pink}║
    ╚══════════════════════════════════════════════════════════════╝{Colors.RESET}
-""")
+"""
+
+
+def print_cyberpunk_banner():
+    """Print epic cyberpunk animated banner with gradients."""
+    clear_screen()
+    print(_render_banner(Colors.enabled))
+
+
+@lru_cache(maxsize=2)
+def _divider(color: bool) -> str:
+    return f"\n   {Colors.gradient_text('═' * 64, [Colors.NEON_CYAN, Colors.NEON_BLUE, Colors.NEON_PURPLE, Colors.NEON_PINK])}\n"
 
 
 def print_glowing_divider():
     """Print a glowing cyberpunk divider."""
-    gradient = [Colors.NEON_CYAN, Colors.NEON_BLUE, Colors.NEON_PURPLE, Colors.NEON_PINK]
-    line = "═" * 64
-    print(f"\n   {Colors.gradient_text(line, gradient)}\n")
+    print(_divider(Colors.enabled))
+
+
+@lru_cache(maxsize=2)
+def _step_template(color: bool) -> str:
+    return f"""
+   {Colors.NEON_PINK}┌─────────────────────────────────────────────────────────────┐{Colors.RESET}
+   {Colors.NEON_PINK}│{Colors.RESET}  {Colors.NEON_YELLOW}⚡{Colors.RESET} {Colors.BOLD}STEP {{step_num}}/{{total_steps}}{Colors.RESET}  {Colors.GRAY}│{Colors.RESET}  {{title_color}}{{title}}{Colors.RESET}
+   {Colors.NEON_PINK}│{Colors.RESET}  {Colors.NEON_CYAN}{{progress}}{Colors.RESET}
+   {Colors.NEON_PINK}└─────────────────────────────────────────────────────────────┘{Colors.RESET}"""
+
+
+_STEP_TITLE_COLORS = ('NEON_PINK', 'NEON_PURPLE', 'NEON_CYAN', 'NEON_BLUE')
 
 
 def print_step_cyberpunk(step_num, total_steps, title):
     """Print cyberpunk styled step indicator."""
     progress = "●" * step_num + "○" * (total_steps - step_num)
-    colors = [Colors.NEON_PINK, Colors.NEON_PURPLE, Colors.NEON_CYAN, Colors.NEON_BLUE]
     
-    print(f"""
-   {Colors.NEON_PINK}┌─────────────────────────────────────────────────────────────┐{Colors.RESET}
-   {Colors.NEON_PINK}│{Colors.RESET}  {Colors.NEON_YELLOW}⚡{Colors.RESET} {Colors.BOLD}STEP {step_num}/{total_steps}{Colors.RESET}  {Colors.GRAY}│{Colors.RESET}  {colors[step_num-1]}{title}{Colors.RESET}
-   {Colors.NEON_PINK}│{Colors.RESET}  {Colors.NEON_CYAN}{progress}{Colors.RESET}
-   {Colors.NEON_PINK}└─────────────────────────────────────────────────────────────┘{Colors.RESET}""")
+    print(_step_template(Colors.enabled).format(
+        step_num=step_num, total_steps=total_steps,
+        title_color=getattr(Colors, _STEP_TITLE_COLORS[step_num - 1]),
+        title=title, progress=progress))
+
+
+_LOADER_FRAMES = (
+    "▰▱▱▱▱▱▱", "▰▰▱▱▱▱▱", "▰▰▰▱▱▱▱", "▰▰▰▰▱▱▱",
+    "▰▰▰▰▰▱▱", "▰▰▰▰▰▰▱", "▰▰▰▰▰▰▰", "▱▰▰▰▰▰▰",
+    "▱▱▰▰▰▰▰", "▱▱▱▰▰▰▰", "▱▱▱▱▰▰▰", "▱▱▱▱▱▰▰",
+    "▱▱▱▱▱▱▰", "▱▱▱▱▱▱▱"
+)
+_LOADER_COLORS = ('NEON_CYAN', 'NEON_BLUE', 'NEON_PURPLE', 'NEON_PINK')
+_LOADER_INTERVAL = 0.06
+# Frame and color indices both wrap at their least common multiple.
+_LOADER_CYCLE = (len(_LOADER_FRAMES) * len(_LOADER_COLORS)
+                 // math.gcd(len(_LOADER_FRAMES), len(_LOADER_COLORS)))
+
+
+@lru_cache(maxsize=32)
+def _loader_frames(message: str, color: bool) -> Tuple[str, ...]:
+    """Pre-render every distinct loader frame for a message."""
+    colors = [getattr(Colors, name) for name in _LOADER_COLORS]
+    label = f"{Colors.RESET} {Colors.GRAY}{message}{Colors.RESET}"
+    return tuple(
+        f"\r   {colors[i % len(colors)]}{_LOADER_FRAMES[i % len(_LOADER_FRAMES)]}{label}"
+        for i in range(_LOADER_CYCLE)
+    )
+
 
+# Loaders are pure decoration; skip them when nobody is watching, under
+# CHROMEFORGE_FAST, or with --fast. Decided per run, not at import.
+def _should_animate(fast: bool) -> bool:
+    """True if this run should play the loader animations."""
+    return not fast and _stdout_is_tty() and not os.environ.get('CHROMEFORGE_FAST')
 
-def animate_cyber_loader(message, duration=0.8):
+
+def animate_cyber_loader(message, duration=0.8, animate=True):
     """Cyberpunk loading animation with neon effect."""
-    frames = [
-        "▰▱▱▱▱▱▱", "▰▰▱▱▱▱▱", "▰▰▰▱▱▱▱", "▰▰▰▰▱▱▱",
-        "▰▰▰▰▰▱▱", "▰▰▰▰▰▰▱", "▰▰▰▰▰▰▰", "▱▰▰▰▰▰▰",
-        "▱▱▰▰▰▰▰", "▱▱▱▰▰▰▰", "▱▱▱▱▰▰▰", "▱▱▱▱▱▰▰",
-        "▱▱▱▱▱▱▰", "▱▱▱▱▱▱▱"
-    ]
-    colors = [Colors.NEON_CYAN, Colors.NEON_BLUE, Colors.NEON_PURPLE, Colors.NEON_PINK]
-    
-    end_time = time.time() + duration
+    if not animate:
+        print(f"   {Colors.NEON_GREEN}▰▰▰▰▰▰▰{Colors.RESET} {Colors.WHITE}{message}{Colors.RESET} {Colors.NEON_GREEN}✓{Colors.RESET}")
+        return
+    
+    frames = _loader_frames(message, Colors.enabled)
+    write, flush = sys.stdout.write, sys.stdout.flush
+    monotonic, sleep = time.monotonic, time.sleep
+    
+    # Frames are paced against fixed deadlines, so slow writes do not push
+    # the animation past its duration
+    start = monotonic()
+    end_time = start + duration
     i = 0
-    while time.time() < end_time:
-        color = colors[i % len(colors)]
-        frame = frames[i % len(frames)]
-        print(f"\r   {color}{frame}{Colors.RESET} {Colors.GRAY}{message}{Colors.RESET}", end='', flush=True)
-        time.sleep(0.06)
+    while monotonic() < end_time:
+        write(frames[i % _LOADER_CYCLE])
+        flush()
         i += 1
+        delay = min(start + i * _LOADER_INTERVAL, end_time) - monotonic()
+        if delay > 0:
+            sleep(delay)
     print(f"\r   {Colors.NEON_GREEN}▰▰▰▰▰▰▰{Colors.RESET} {Colors.WHITE}{message}{Colors.RESET} {Colors.NEON_GREEN}✓{Colors.RESET}           ")
 
 
+_PROGRESS_WIDTH = 40
+_BLOCKS = tuple('█' * i for i in range(_PROGRESS_WIDTH + 1))
+_SHADES = tuple('░' * i for i in range(_PROGRESS_WIDTH + 1))
+
+
+@lru_cache(maxsize=2)
+def _progress_template(color: bool) -> str:
+    return (
+        f"\r   {Colors.NEON_PINK}[{Colors.RESET}{{filled}}{Colors.GRAY}{{empty}}{Colors.RESET}"
+        f"{Colors.NEON_PINK}]{Colors.RESET} {Colors.NEON_YELLOW}{{percent}}%{Colors.RESET} "
+        f"{Colors.GRAY}{{label}}{Colors.RESET}"
+    )
+
+
 def print_neon_progress_bar(progress, total, label=""):
     """Print a neon-styled progress bar."""
-    width = 40
+    width = _PROGRESS_WIDTH
     filled = int(width * progress / total)
     empty = width - filled
     
-    # Gradient effect on filled portion
-    bar_filled = ""
-    for i in range(filled):
-        if i < filled // 3:
-            bar_filled += f"{Colors.NEON_CYAN}█"
-        elif i < 2 * filled // 3:
-            bar_filled += f"{Colors.NEON_PURPLE}█"
-        else:
-            bar_filled += f"{Colors.NEON_PINK}█"
+    # Gradient effect on filled portion: cyan, purple, pink thirds
+    cyan = filled // 3
+    purple = 2 * filled // 3 - cyan
+    pink = filled - cyan - purple
+    bar_filled = "".join((
+        Colors.NEON_CYAN + _BLOCKS[cyan] if cyan else "",
+        Colors.NEON_PURPLE + _BLOCKS[purple] if purple else "",
+        Colors.NEON_PINK + _BLOCKS[pink] if pink else "",
+    ))
     
-    bar_empty = f"{Colors.GRAY}{'░' * empty}{Colors.RESET}"
     percent = int(100 * progress / total)
     
-    print(f"\r   {Colors.NEON_PINK}[{Colors.RESET}{bar_filled}{bar_empty}{Colors.NEON_PINK}]{Colors.RESET} {Colors.NEON_YELLOW}{percent}%{Colors.RESET} {Colors.GRAY}{label}{Colors.RESET}", end='', flush=True)
+    print(_progress_template(Colors.enabled).format(filled=bar_filled, empty=_SHADES[empty],
+                                                    percent=percent, label=label),
+          end='', flush=True)
+
+
+_COMPONENT_ICONS = {
+    "popup": "🎯", "content_script": "📜", "background": "⚙️",
+    "storage": "💾", "css": "🎨"
+}
+
+
+@lru_cache(maxsize=2)
+def _analysis_templates(color: bool) -> Dict[str, Any]:
+    """Build the analysis card templates for the current color mode."""
+    header = f"""
+   {Colors.NEON_CYAN}╔══════════════════════════════════════════════════════════╗{Colors.RESET}
+   {Colors.NEON_CYAN}║{Colors.RESET}  {Colors.NEON_YELLOW}◈{Colors.RESET} {Colors.BOLD_WHITE}NEURAL ANALYSIS COMPLETE{Colors.RESET}                             {Colors.NEON_CYAN}║{Colors.RESET}
+   {Colors.NEON_CYAN}╠══════════════════════════════════════════════════════════╣{Colors.RESET}"""
+    divider = f"   {Colors.NEON_CYAN}╠══════════════════════════════════════════════════════════╣{Colors.RESET}"
+    footer = f"   {Colors.NEON_CYAN}╚══════════════════════════════════════════════════════════╝{Colors.RESET}"
+    status = {
+        valid: f"   {Colors.NEON_CYAN}║{Colors.RESET}  {Colors.GRAY}Status:{Colors.RESET} {icon}                                        {Colors.NEON_CYAN}║{Colors.RESET}"
+        for valid, icon in ((True, f"{Colors.NEON_GREEN}◉ VALID{Colors.RESET}"),
+                            (False, f"{Colors.NEON_RED}◉ INVALID{Colors.RESET}"))
+    }
+    intent = f"   {Colors.NEON_CYAN}║{Colors.RESET}  {Colors.GRAY}Intent:{Colors.RESET} {Colors.NEON_PURPLE}{{intent:<20}}{Colors.RESET} {Colors.NEON_CYAN}{{bar}}{Colors.RESET} {Colors.NEON_YELLOW}{{confidence:.0%}}{Colors.RESET}   {Colors.NEON_CYAN}║{Colors.RESET}"
+    components_header = f"   {Colors.NEON_CYAN}║{Colors.RESET}  {Colors.NEON_PINK}◈{Colors.RESET} {Colors.BOLD}DETECTED COMPONENTS{Colors.RESET}                                  {Colors.NEON_CYAN}║{Colors.RESET}"
+    component = f"   {Colors.NEON_CYAN}║{Colors.RESET}    {{icon}} {{component:<15}} {{status}}                      {Colors.NEON_CYAN}║{Colors.RESET}"
+    component_status = {
+        True: f"{Colors.NEON_GREEN}◉ ENABLED{Colors.RESET}",
+        False: f"{Colors.GRAY}○ disabled{Colors.RESET}"
+    }
+    features_header = f"   {Colors.NEON_CYAN}║{Colors.RESET}  {Colors.NEON_YELLOW}⚡{Colors.RESET} {Colors.BOLD}FEATURES ACTIVATED{Colors.RESET}                                   {Colors.NEON_CYAN}║{Colors.RESET}"
+    feature = f"   {Colors.NEON_CYAN}║{Colors.RESET}    {Colors.NEON_GREEN}▸{Colors.RESET} {{feature:<50}}   {Colors.NEON_CYAN}║{Colors.RESET}"
+    sites_header = f"   {Colors.NEON_CYAN}║{Colors.RESET}  {Colors.NEON_RED}🚫{Colors.RESET} {Colors.BOLD}SITES TO BLOCK{Colors.RESET}                                       {Colors.NEON_CYAN}║{Colors.RESET}"
+    site = f"   {Colors.NEON_CYAN}║{Colors.RESET}    {Colors.NEON_RED}✖{Colors.RESET} {{site:<50}}   {Colors.NEON_CYAN}║{Colors.RESET}"
+
+    # The whole card as one template; optional sections are filled in as
+    # ready-made blocks (each line ending in a newline) or left empty
+    card = (
+        header + "\n{status}\n{intent}" +
+        divider + "\n" + components_header + "\n{components}{features}{sites}" +
+        footer
+    )
+    features_section = divider + "\n" + features_header + "\n"
+    sites_section = divider + "\n" + sites_header + "\n"
+    
+    return {
+        "card": card,
+        "features_section": features_section,
+        "sites_section": sites_section,
+        "status": status,
+        "intent": intent,
+        "component": component,
+        "component_status": component_status,
+        "feature": feature,
+        "site": site,
+    }
 
 
 def print_analysis_cyberpunk(analysis: Dict[str, Any]):
     """Print analysis in cyberpunk holographic card style."""
-    
-    print(f"""
-   {Colors.NEON_CYAN}╔══════════════════════════════════════════════════════════╗{Colors.RESET}
-   {Colors.NEON_CYAN}║{Colors.RESET}  {Colors.NEON_YELLOW}◈{Colors.RESET} {Colors.BOLD}{Colors.WHITE}NEURAL ANALYSIS COMPLETE{Colors.RESET}                             {Colors.NEON_CYAN}║{Colors.RESET}
-   {Colors.NEON_CYAN}╠══════════════════════════════════════════════════════════╣{Colors.RESET}""")
-    
-    # Status
-    status_icon = f"{Colors.NEON_GREEN}◉ VALID{Colors.RESET}" if analysis['valid'] else f"{Colors.NEON_RED}◉ INVALID{Colors.RESET}"
-    print(f"   {Colors.NEON_CYAN}║{Colors.RESET}  {Colors.GRAY}Status:{Colors.RESET} {status_icon}                                        {Colors.NEON_CYAN}║{Colors.RESET}")
+    templates = _analysis_templates(Colors.enabled)
     
     # Intent
+    intent_row = ""
     if analysis['intents']:
         top_intent = max(analysis['intents'].items(), key=lambda x: x[1])
         intent_bar = "█" * int(top_intent[1] * 10) + "░" * (10 - int(top_intent[1] * 10))
-        print(f"   {Colors.NEON_CYAN}║{Colors.RESET}  {Colors.GRAY}Intent:{Colors.RESET} {Colors.NEON_PURPLE}{top_intent[0]:<20}{Colors.RESET} {Colors.NEON_CYAN}{intent_bar}{Colors.RESET} {Colors.NEON_YELLOW}{top_intent[1]:.0%}{Colors.RESET}   {Colors.NEON_CYAN}║{Colors.RESET}")
-    
-    print(f"   {Colors.NEON_CYAN}╠══════════════════════════════════════════════════════════╣{Colors.RESET}")
-    print(f"   {Colors.NEON_CYAN}║{Colors.RESET}  {Colors.NEON_PINK}◈{Colors.RESET} {Colors.BOLD}DETECTED COMPONENTS{Colors.RESET}                                  {Colors.NEON_CYAN}║{Colors.RESET}")
+        intent_row = templates["intent"].format(intent=top_intent[0], bar=intent_bar, confidence=top_intent[1]) + "\n"
     
     # Components with icons
-    comp_icons = {
-        "popup": "🎯", "content_script": "📜", "background": "⚙️",
-        "storage": "💾", "css": "🎨"
-    }
-    
-    for comp, needed in analysis['components'].items():
-        icon = comp_icons.get(comp, "•")
-        status = f"{Colors.NEON_GREEN}◉ ENABLED{Colors.RESET}" if needed else f"{Colors.GRAY}○ disabled{Colors.RESET}"
-        print(f"   {Colors.NEON_CYAN}║{Colors.RESET}    {icon} {comp:<15} {status}                      {Colors.NEON_CYAN}║{Colors.RESET}")
+    components = "".join(
+        templates["component"].format(icon=_COMPONENT_ICONS.get(comp, "•"), component=comp,
+                                      status=templates["component_status"][bool(needed)]) + "\n"
+        for comp, needed in analysis['components'].items()
+    )
     
     # Features
+    features = ""
     active_features = [k for k, v in analysis['features'].items() if v]
     if active_features:
-        print(f"   {Colors.NEON_CYAN}╠══════════════════════════════════════════════════════════╣{Colors.RESET}")
-        print(f"   {Colors.NEON_CYAN}║{Colors.RESET}  {Colors.NEON_YELLOW}⚡{Colors.RESET} {Colors.BOLD}FEATURES ACTIVATED{Colors.RESET}                                   {Colors.NEON_CYAN}║{Colors.RESET}")
-        for feat in active_features[:4]:
-            feat_name = feat.replace('_', ' ').title()
-            print(f"   {Colors.NEON_CYAN}║{Colors.RESET}    {Colors.NEON_GREEN}▸{Colors.RESET} {feat_name:<50}   {Colors.NEON_CYAN}║{Colors.RESET}")
+        features = templates["features_section"] + "".join(
+            templates["feature"].format(feature=feat.replace('_', ' ').title()) + "\n"
+            for feat in active_features[:4]
+        )
     
     # Blocked sites
+    sites = ""
     if analysis['blocked_sites']:
-        print(f"   {Colors.NEON_CYAN}╠══════════════════════════════════════════════════════════╣{Colors.RESET}")
-        print(f"   {Colors.NEON_CYAN}║{Colors.RESET}  {Colors.NEON_RED}🚫{Colors.RESET} {Colors.BOLD}SITES TO BLOCK{Colors.RESET}                                       {Colors.NEON_CYAN}║{Colors.RESET}")
-        for site in analysis['blocked_sites'][:3]:
-            print(f"   {Colors.NEON_CYAN}║{Colors.RESET}    {Colors.NEON_RED}✖{Colors.RESET} {site:<50}   {Colors.NEON_CYAN}║{Colors.RESET}")
-    
-    print(f"   {Colors.NEON_CYAN}╚══════════════════════════════════════════════════════════╝{Colors.RESET}")
-
-
-def print_success_cyberpunk(output_dir: Path):
-    """Print epic cyberpunk success message with baby step instructions."""
-    
-    print(f"""
+        sites = templates["sites_section"] + "".join(
+            templates["site"].format(site=site) + "\n" for site in analysis['blocked_sites'][:3]
+        )
+    
+    print(templates["card"].format_map({
+        "status": templates["status"][bool(analysis['valid'])],
+        "intent": intent_row,
+        "components": components,
+        "features": features,
+        "sites": sites,
+    }))
+
+
+@lru_cache(maxsize=2)
+def _success_template(color: bool) -> str:
+    return f"""
    {Colors.NEON_GREEN}╔══════════════════════════════════════════════════════════════╗{Colors.RESET}
    {Colors.NEON_GREEN}║{Colors.RESET}                                                              {Colors.NEON_GREEN}║{Colors.RESET}
    {Colors.NEON_GREEN}║{Colors.RESET}   {Colors.NEON_YELLOW}★ ═══════════════════════════════════════════════════ ★{Colors.RESET}   {Colors.NEON_GREEN}║{Colors.RESET}
    {Colors.NEON_GREEN}║{Colors.RESET}   {Colors.NEON_YELLOW}║{Colors.RESET}                                                     {Colors.NEON_YELLOW}║{Colors.RESET}   {Colors.NEON_GREEN}║{Colors.RESET}
-   {Colors.NEON_GREEN}║{Colors.RESET}   {Colors.NEON_YELLOW}║{Colors.RESET}    {Colors.BOLD}{Colors.NEON_CYAN}✨ EXTENSION FORGED SUCCESSFULLY! ✨{Colors.RESET}        {Colors.NEON_YELLOW}║{Colors.RESET}   {Colors.NEON_GREEN}║{Colors.RESET}
+   {Colors.NEON_GREEN}║{Colors.RESET}   {Colors.NEON_YELLOW}║{Colors.RESET}    {Colors.BOLD_CYAN}✨ EXTENSION FORGED SUCCESSFULLY! ✨{Colors.RESET}        {Colors.NEON_YELLOW}║{Colors.RESET}   {Colors.NEON_GREEN}║{Colors.RESET}
    {Colors.NEON_GREEN}║{Colors.RESET}   {Colors.NEON_YELLOW}║{Colors.RESET}                                                     {Colors.NEON_YELLOW}║{Colors.RESET}   {Colors.NEON_GREEN}║{Colors.RESET}
    {Colors.NEON_GREEN}║{Colors.RESET}   {Colors.NEON_YELLOW}★ ═══════════════════════════════════════════════════ ★{Colors.RESET}   {Colors.NEON_GREEN}║{Colors.RESET}
    {Colors.NEON_GREEN}║{Colors.RESET}                                                              {Colors.NEON_GREEN}║{Colors.RESET}
    {Colors.NEON_GREEN}╚══════════════════════════════════════════════════════════════╝{Colors.RESET}
 
    {Colors.NEON_PURPLE}📁 YOUR EXTENSION IS READY AT:{Colors.RESET}
-   {Colors.NEON_CYAN}   {output_dir}{Colors.RESET}
+   {Colors.NEON_CYAN}   {{output_dir}}{Colors.RESET}
 
    {Colors.NEON_PINK}╔══════════════════════════════════════════════════════════════╗{Colors.RESET}
-   {Colors.NEON_PINK}║{Colors.RESET}  {Colors.NEON_YELLOW}🚀{Colors.RESET} {Colors.BOLD}{Colors.WHITE}LOAD YOUR EXTENSION IN CHROME - BABY STEPS{Colors.RESET}           {Colors.NEON_PINK}║{Colors.RESET}
+   {Colors.NEON_PINK}║{Colors.RESET}  {Colors.NEON_YELLOW}🚀{Colors.RESET} {Colors.BOLD_WHITE}LOAD YOUR EXTENSION IN CHROME - BABY STEPS{Colors.RESET}           {Colors.NEON_PINK}║{Colors.RESET}
    {Colors.NEON_PINK}╠══════════════════════════════════════════════════════════════╣{Colors.RESET}
    {Colors.NEON_PINK}║{Colors.RESET}                                                              {Colors.NEON_PINK}║{Colors.RESET}
    {Colors.NEON_PINK}║{Colors.RESET}  {Colors.NEON_CYAN}STEP 1:{Colors.RESET} {Colors.WHITE}Open Google Chrome browser{Colors.RESET}                       {Colors.NEON_PINK}║{Colors.RESET}
@@ -1542,15 +2091,20 @@ def print_success_cyberpunk(output_dir: Path):
    {Colors.NEON_CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Colors.RESET}
    {Colors.NEON_PURPLE}🎮{Colors.RESET} {Colors.GRAY}Built with{Colors.RESET} {Colors.NEON_PINK}♥{Colors.RESET} {Colors.GRAY}by ChromeForge │ FAST University Tech Society{Colors.RESET}
    {Colors.NEON_CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Colors.RESET}
-""")
+"""
 
 
-def get_user_prompt_cyberpunk() -> str:
-    """Get prompt from user with cyberpunk UI."""
-    
-    print(f"""
+def print_success_cyberpunk(output_dir: Path):
+    """Print epic cyberpunk success message with baby step instructions."""
+    print(_success_template(Colors.enabled).format(output_dir=output_dir))
+
+
+@lru_cache(maxsize=2)
+def _prompt_templates(color: bool) -> Tuple[str, str]:
+    """Build the prompt box and the input line for the current color mode."""
+    box = f"""
    {Colors.NEON_PURPLE}╔══════════════════════════════════════════════════════════════╗{Colors.RESET}
-   {Colors.NEON_PURPLE}║{Colors.RESET}  {Colors.NEON_YELLOW}💡{Colors.RESET} {Colors.BOLD}{Colors.WHITE}DESCRIBE YOUR EXTENSION{Colors.RESET}                                {Colors.NEON_PURPLE}║{Colors.RESET}
+   {Colors.NEON_PURPLE}║{Colors.RESET}  {Colors.NEON_YELLOW}💡{Colors.RESET} {Colors.BOLD_WHITE}DESCRIBE YOUR EXTENSION{Colors.RESET}                                {Colors.NEON_PURPLE}║{Colors.RESET}
    {Colors.NEON_PURPLE}║{Colors.RESET}                                                              {Colors.NEON_PURPLE}║{Colors.RESET}
    {Colors.NEON_PURPLE}║{Colors.RESET}  {Colors.GRAY}Tell me what you want your Chrome extension to do.{Colors.RESET}        {Colors.NEON_PURPLE}║{Colors.RESET}
    {Colors.NEON_PURPLE}║{Colors.RESET}  {Colors.GRAY}Just describe it in plain English - like talking to a{Colors.RESET}     {Colors.NEON_PURPLE}║{Colors.RESET}
@@ -1565,10 +2119,18 @@ def get_user_prompt_cyberpunk() -> str:
    {Colors.NEON_PURPLE}║{Colors.RESET}  {Colors.NEON_GREEN}▸{Colors.RESET} {Colors.WHITE}"Change all text to blue when I click a button"{Colors.RESET}      {Colors.NEON_PURPLE}║{Colors.RESET}
    {Colors.NEON_PURPLE}║{Colors.RESET}                                                              {Colors.NEON_PURPLE}║{Colors.RESET}
    {Colors.NEON_PURPLE}╚══════════════════════════════════════════════════════════════╝{Colors.RESET}
-""")
+"""
+    prompt_input = f"   {Colors.NEON_PINK}▶{Colors.RESET} {Colors.NEON_CYAN}Your idea:{Colors.RESET} "
+    return box, prompt_input
+
+
+def get_user_prompt_cyberpunk() -> str:
+    """Get prompt from user with cyberpunk UI."""
+    box, prompt_input = _prompt_templates(Colors.enabled)
+    print(box)
     
     try:
-        prompt = input(f"   {Colors.NEON_PINK}▶{Colors.RESET} {Colors.NEON_CYAN}Your idea:{Colors.RESET} ").strip()
+        prompt = input(prompt_input).strip()
     except (EOFError, KeyboardInterrupt):
         prompt = ""
     
@@ -1577,11 +2139,18 @@ def get_user_prompt_cyberpunk() -> str:
 
 def main():
     """Main entry point with cyberpunk UX."""
+    args = [arg for arg in sys.argv[1:] if arg != '--fast']
+    animate = _should_animate(fast=len(args) < len(sys.argv) - 1)
+    if _color_enabled():
+        Colors.enable()
+    else:
+        Colors.disable()
+    
     print_cyberpunk_banner()
     
     # Get prompt
-    if len(sys.argv) > 1:
-        prompt = ' '.join(sys.argv[1:]).strip()
+    if args:
+        prompt = ' '.join(args).strip()
         print(f"\n   {Colors.NEON_PURPLE}▶{Colors.RESET} {Colors.GRAY}Using prompt:{Colors.RESET} {Colors.WHITE}{prompt}{Colors.RESET}\n")
     else:
         prompt = get_user_prompt_cyberpunk()
@@ -1596,12 +2165,11 @@ def main():
     # STEP 1: PART A - Analyze prompt
     # ═══════════════════════════════════════════════════════════════
     print_step_cyberpunk(1, 4, "ANALYZING YOUR IDEA")
-    animate_cyber_loader("Scanning keywords...", 0.5)
-    animate_cyber_loader("Detecting intent...", 0.4)
-    animate_cyber_loader("Mapping components...", 0.4)
+    animate_cyber_loader("Scanning keywords...", 0.5, animate)
+    animate_cyber_loader("Detecting intent...", 0.4, animate)
+    animate_cyber_loader("Mapping components...", 0.4, animate)
     
-    analyzer = PromptAnalyzer(prompt)
-    analysis = analyzer.analyze()
+    analysis = PromptAnalyzer.analyze_prompt(prompt)
     
     print_neon_progress_bar(1, 1, "Analysis complete!")
     print("\n")
@@ -1612,9 +2180,9 @@ def main():
     # STEP 2: PART B - Build manifest
     # ═══════════════════════════════════════════════════════════════
     print_step_cyberpunk(2, 4, "BUILDING MANIFEST V3")
-    animate_cyber_loader("Creating manifest structure...", 0.5)
-    animate_cyber_loader("Adding permissions...", 0.3)
-    animate_cyber_loader("Validating JSON...", 0.3)
+    animate_cyber_loader("Creating manifest structure...", 0.5, animate)
+    animate_cyber_loader("Adding permissions...", 0.3, animate)
+    animate_cyber_loader("Validating JSON...", 0.3, animate)
     
     manifest_builder = ManifestBuilder(analysis)
     manifest = manifest_builder.build()
@@ -1636,9 +2204,10 @@ def main():
     
     total_files = len(code_files)
     for i, filename in enumerate(code_files.keys(), 1):
-        animate_cyber_loader(f"Forging {filename}...", 0.3)
+        animate_cyber_loader(f"Forging {filename}...", 0.3, animate)
         print_neon_progress_bar(i, total_files, filename)
-        time.sleep(0.1)
+        if animate:
+            time.sleep(0.1)
     
     print(f"\n\n   {Colors.NEON_GREEN}✓{Colors.RESET} {Colors.WHITE}Generated {total_files} files{Colors.RESET}")
     
@@ -1650,17 +2219,17 @@ def main():
     output_dir = Path.cwd() / OUTPUT_DIR_NAME
     fs_manager = FileSystemManager(output_dir)
     
-    animate_cyber_loader("Preparing output directory...", 0.3)
+    animate_cyber_loader("Preparing output directory...", 0.3, animate)
     
     if not fs_manager.prepare_directory():
         return 1
     
-    animate_cyber_loader("Writing files to disk...", 0.4)
+    animate_cyber_loader("Writing files to disk...", 0.4, animate)
     
     if not fs_manager.write_all_files(manifest, code_files):
         return 1
     
-    animate_cyber_loader("Validating extension structure...", 0.3)
+    animate_cyber_loader("Validating extension structure...", 0.3, animate)
     
     # Validate final output
     is_valid, errors = fs_manager.validate_extension()
@@ -19,7 +19,10 @@ import sys
 import json
 import shutil
 import subprocess
+import py_compile
 import re
+import io
+from functools import lru_cache
 from pathlib import Path
 
 # Test configuration
@@ -27,6 +30,23 @@ SCRIPT_PATH = Path(__file__).parent / "chrome_forge.py"
 OUTPUT_DIR = Path(__file__).parent / "generated_extension"
 BACKUP_DIR = Path(__file__).parent / "generated_extension_backup"
 
+# Manifest rules, built once rather than on every validate_manifest() call
+VERSION_RE = re.compile(r'^\d+(\.\d+)*$')
+VALID_PERMISSIONS = frozenset({
+    "activeTab", "tabs", "storage", "scripting", "webRequest",
+    "declarativeNetRequest", "declarativeNetRequestWithHostAccess",
+    "alarms", "notifications", "contextMenus", "history", "bookmarks",
+    "downloads", "geolocation", "management", "cookies"
+})
+
+# Run chrome_forge in this interpreter when it imports cleanly; otherwise
+# fall back to a subprocess per scenario and let the pre-check report why
+sys.path.insert(0, str(SCRIPT_PATH.parent))
+try:
+    import chrome_forge
+except Exception:
+    chrome_forge = None
+
 # ANSI colors
 class C:
     R = '\033[91m'  # Red
@@ -70,18 +90,96 @@ def cleanup():
         shutil.rmtree(OUTPUT_DIR)
     if BACKUP_DIR.exists():
         shutil.rmtree(BACKUP_DIR)
+    _load_manifest.cache_clear()
+    _read_text.cache_clear()
+    _output_names.cache_clear()
+
+@lru_cache(maxsize=8)
+def _output_names(dir_str, mtime_ns):
+    with os.scandir(dir_str) as entries:
+        return frozenset(entry.name for entry in entries)
+
+def output_has(name):
+    """Check for a generated file against one directory listing per write."""
+    try:
+        mtime_ns = OUTPUT_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    return name in _output_names(str(OUTPUT_DIR), mtime_ns)
+
+def read_file(path):
+    """Read a whole file with one open, one fstat and (normally) one read."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+@lru_cache(maxsize=8)
+def _load_manifest(path_str, mtime_ns):
+    return json.loads(read_file(path_str))
+
+def load_manifest(manifest_path=OUTPUT_DIR / "manifest.json"):
+    """Parse a manifest once per write; checks share the parsed dict read-only."""
+    return _load_manifest(str(manifest_path), manifest_path.stat().st_mtime_ns)
+
+@lru_cache(maxsize=32)
+def _read_text(path_str, mtime_ns):
+    return read_file(path_str).decode('utf-8', 'replace')
+
+def read_cached(path):
+    """Decode a generated file once per write, however many checks read it."""
+    return _read_text(str(path), path.stat().st_mtime_ns)
 
 def run_chrome_forge(prompt):
     """Run chrome_forge.py with a prompt and return success status."""
+    if chrome_forge is None:
+        return run_chrome_forge_subprocess(prompt)
+    
+    # Feed the prompt through stdin and capture the screen, as the
+    # subprocess did, but without paying interpreter startup per scenario.
+    # Start each run without the previous scenario's cached analyses
+    chrome_forge._analyze_cached.cache_clear()
+    saved = sys.stdin, sys.stdout, sys.argv
+    sys.stdin = io.StringIO(prompt)
+    sys.stdout = stdout = io.StringIO()
+    sys.argv = [str(SCRIPT_PATH), "--fast"]
+    try:
+        returncode = chrome_forge.main()
+    except SystemExit as e:
+        # sys.exit() inside main() must fail this scenario, not end the suite
+        if e.code not in (None, 0):
+            return False, stdout.getvalue(), f"SystemExit: {e.code}"
+        returncode = 0
+    except Exception as e:
+        return False, stdout.getvalue(), f"{type(e).__name__}: {e}"
+    finally:
+        sys.stdin, sys.stdout, sys.argv = saved
+    return returncode == 0, stdout.getvalue(), ""
+
+def run_chrome_forge_subprocess(prompt):
+    """Run chrome_forge.py in a fresh interpreter and return success status."""
     try:
+        # Capture raw bytes with the child's streams pinned to UTF-8; only a
+        # failed run's output is ever shown, so only then is it decoded
         result = subprocess.run(
             ["python3", str(SCRIPT_PATH)],
-            input=prompt,
+            input=prompt.encode('utf-8'),
             capture_output=True,
-            text=True,
-            timeout=30
+            timeout=30,
+            env={**os.environ, "PYTHONIOENCODING": "utf-8"}
         )
-        return result.returncode == 0, result.stdout, result.stderr
+        if result.returncode == 0:
+            return True, "", ""
+        return (False, result.stdout.decode('utf-8', 'replace'),
+                result.stderr.decode('utf-8', 'replace'))
     except Exception as e:
         return False, "", str(e)
 
@@ -89,12 +187,23 @@ def validate_manifest(manifest_path):
     """Strictly validate manifest.json against Manifest V3 spec."""
     errors = []
     
-    if not manifest_path.exists():
+    # One directory read instead of a stat per referenced file; is_file()
+    # comes from the same read, so a directory can't pass for a file. Nested
+    # paths fall back to an is_file() check
+    try:
+        with os.scandir(manifest_path.parent) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        present = set()
+    
+    def file_exists(name):
+        return name in present or (manifest_path.parent / name).is_file()
+    
+    if manifest_path.name not in present:
         return False, ["manifest.json does not exist"]
     
     try:
-        with open(manifest_path, 'r') as f:
-            manifest = json.load(f)
+        manifest = load_manifest(manifest_path)
     except json.JSONDecodeError as e:
         return False, [f"Invalid JSON: {e}"]
     
@@ -110,23 +219,21 @@ def validate_manifest(manifest_path):
     
     # VERSION FORMAT
     version = manifest.get("version", "")
-    if not re.match(r'^\d+(\.\d+)*$', version):
+    if not VERSION_RE.match(version):
         errors.append(f"Invalid version format: {version}")
     
     # VALIDATE ACTION (popup)
     if "action" in manifest:
         action = manifest["action"]
         if "default_popup" in action:
-            popup_path = manifest_path.parent / action["default_popup"]
-            if not popup_path.exists():
+            if not file_exists(action["default_popup"]):
                 errors.append(f"default_popup file missing: {action['default_popup']}")
     
     # VALIDATE BACKGROUND
     if "background" in manifest:
         bg = manifest["background"]
         if "service_worker" in bg:
-            bg_path = manifest_path.parent / bg["service_worker"]
-            if not bg_path.exists():
+            if not file_exists(bg["service_worker"]):
                 errors.append(f"service_worker file missing: {bg['service_worker']}")
         # MV3 must use service_worker, not scripts
         if "scripts" in bg:
@@ -138,23 +245,15 @@ def validate_manifest(manifest_path):
             if "matches" not in cs:
                 errors.append(f"content_scripts[{i}] missing 'matches'")
             for js_file in cs.get("js", []):
-                js_path = manifest_path.parent / js_file
-                if not js_path.exists():
+                if not file_exists(js_file):
                     errors.append(f"content_scripts js file missing: {js_file}")
             for css_file in cs.get("css", []):
-                css_path = manifest_path.parent / css_file
-                if not css_path.exists():
+                if not file_exists(css_file):
                     errors.append(f"content_scripts css file missing: {css_file}")
     
     # VALIDATE PERMISSIONS
-    valid_permissions = {
-        "activeTab", "tabs", "storage", "scripting", "webRequest",
-        "declarativeNetRequest", "declarativeNetRequestWithHostAccess",
-        "alarms", "notifications", "contextMenus", "history", "bookmarks",
-        "downloads", "geolocation", "management", "cookies"
-    }
     for perm in manifest.get("permissions", []):
-        if perm not in valid_permissions and not perm.startswith("http"):
+        if perm not in VALID_PERMISSIONS and not perm.startswith("http"):
             # Allow host permissions in permissions array for MV2 compat
             pass
     
@@ -164,8 +263,7 @@ def validate_manifest(manifest_path):
         if "rule_resources" in dnr:
             for rule in dnr["rule_resources"]:
                 if "path" in rule:
-                    rule_path = manifest_path.parent / rule["path"]
-                    if not rule_path.exists():
+                    if not file_exists(rule["path"]):
                         errors.append(f"rules file missing: {rule['path']}")
     
     return len(errors) == 0, errors
@@ -177,7 +275,7 @@ def validate_html(html_path):
     if not html_path.exists():
         return False, ["HTML file does not exist"]
     
-    content = html_path.read_text()
+    content = read_file(html_path).decode('utf-8', 'replace')
     
     # Check for basic HTML structure
     if "<!DOCTYPE html>" not in content and "<!doctype html>" not in content.lower():
@@ -199,25 +297,27 @@ def validate_html(html_path):
     return len(errors) == 0, errors
 
 def validate_js(js_path, expected_patterns=None):
-    """Validate JavaScript file."""
+    """Validate JavaScript file against (compiled pattern, description) pairs."""
     errors = []
     
     if not js_path.exists():
         return False, ["JS file does not exist"]
     
-    content = js_path.read_text()
+    data = read_file(js_path)
     
-    # Check for syntax errors (basic)
-    if content.count('(') != content.count(')'):
+    # Check for syntax errors (basic); ASCII brackets never occur inside a
+    # UTF-8 multibyte sequence, so counting the raw bytes is exact
+    if data.count(b'(') != data.count(b')'):
         errors.append("Mismatched parentheses")
     
-    if content.count('{') != content.count('}'):
+    if data.count(b'{') != data.count(b'}'):
         errors.append("Mismatched braces")
     
-    # Check expected patterns
+    # Check expected patterns; only these need the decoded text
     if expected_patterns:
+        content = data.decode('utf-8', 'replace')
         for pattern, description in expected_patterns:
-            if not re.search(pattern, content, re.IGNORECASE):
+            if not pattern.search(content):
                 errors.append(f"Missing expected pattern: {description}")
     
     return len(errors) == 0, errors
@@ -229,19 +329,23 @@ def validate_css(css_path):
     if not css_path.exists():
         return False, ["CSS file does not exist"]
     
-    content = css_path.read_text()
+    data = read_file(css_path)
     
-    # Check for basic CSS structure
-    if '{' not in content or '}' not in content:
+    # Check for basic CSS structure; purely structural, so no decode
+    if b'{' not in data or b'}' not in data:
         errors.append("No CSS rules found")
     
-    if content.count('{') != content.count('}'):
+    if data.count(b'{') != data.count(b'}'):
         errors.append("Mismatched braces in CSS")
     
     return len(errors) == 0, errors
 
-def test_scenario(test_num, total, name, prompt, checks):
-    """Run a test scenario with strict validation."""
+def test_scenario(test_num, total, name, prompt, checks, cli=False):
+    """Run a test scenario with strict validation.
+
+    cli=True runs chrome_forge.py as a real command in a fresh interpreter
+    instead of calling main() in-process.
+    """
     print(f"\n{C.C}┌{'─' * 66}┐{C.RESET}")
     print(f"{C.C}│{C.RESET} {C.Y}TEST {test_num:02d}/{total:02d}{C.RESET} │ {C.W}{name:<50}{C.RESET} {C.C}│{C.RESET}")
     print(f"{C.C}├{'─' * 66}┤{C.RESET}")
@@ -251,7 +355,8 @@ def test_scenario(test_num, total, name, prompt, checks):
     cleanup()
     
     # Run chrome_forge
-    success, stdout, stderr = run_chrome_forge(prompt)
+    run = run_chrome_forge_subprocess if cli else run_chrome_forge
+    success, stdout, stderr = run(prompt)
     
     if not success:
         print(f"   {C.R}✗ FAILED{C.RESET} - Script execution failed")
@@ -294,572 +399,561 @@ def test_scenario(test_num, total, name, prompt, checks):
 # ASSIGNMENT SCENARIO TESTS
 # ============================================================================
 
-def test_scenario_1():
-    """
-    SCENARIO 1 (FROM ASSIGNMENT):
-    "Create an extension that shows a popup with today's date."
-    → Requires popup.html + popup.js
-    """
-    def check_popup_html():
-        path = OUTPUT_DIR / "popup.html"
-        valid, errors = validate_html(path)
-        return valid, "; ".join(errors) if errors else ""
-    
-    def check_popup_js():
-        path = OUTPUT_DIR / "popup.js"
-        patterns = [
-            (r'Date|date|getDate|toLocaleDateString', "Date functionality"),
-            (r'getElementById|querySelector|addEventListener', "DOM interaction"),
-        ]
-        valid, errors = validate_js(path, patterns)
-        return valid, "; ".join(errors) if errors else ""
-    
-    def check_manifest_action():
-        manifest = json.load(open(OUTPUT_DIR / "manifest.json"))
-        has_action = "action" in manifest and "default_popup" in manifest.get("action", {})
-        return has_action, "Missing action.default_popup"
-    
-    def check_date_display():
-        """Verify date display logic exists."""
-        popup_js = OUTPUT_DIR / "popup.js"
-        if popup_js.exists():
-            content = popup_js.read_text()
-            has_date = any(x in content.lower() for x in ['date', 'getdate', 'tolocale', 'new date'])
-            return has_date, "No date logic found"
-        return False, "popup.js missing"
-    
-    return test_scenario(
-        1, 20, "ASSIGNMENT SCENARIO 1: Popup with Date",
-        "Create an extension that shows a popup with today's date.",
-        [
+# validate_js expectations, compiled once rather than on every check
+POPUP_DATE_PATTERNS = (
+    (re.compile(r'Date|date|getDate|toLocaleDateString', re.IGNORECASE), "Date functionality"),
+    (re.compile(r'getElementById|querySelector|addEventListener', re.IGNORECASE), "DOM interaction"),
+)
+# Plain substring screens; matched against lowercased text
+DATE_MARKERS = ('date', 'getdate', 'tolocale', 'new date')
+
+# SCENARIO 1 (FROM ASSIGNMENT):
+# "Create an extension that shows a popup with today's date."
+# → Requires popup.html + popup.js
+def check_popup_html():
+    path = OUTPUT_DIR / "popup.html"
+    valid, errors = validate_html(path)
+    return valid, "; ".join(errors) if errors else ""
+
+def check_popup_js():
+    path = OUTPUT_DIR / "popup.js"
+    valid, errors = validate_js(path, POPUP_DATE_PATTERNS)
+    return valid, "; ".join(errors) if errors else ""
+
+def check_manifest_action():
+    manifest = load_manifest()
+    has_action = "action" in manifest and "default_popup" in manifest.get("action", {})
+    return has_action, "Missing action.default_popup"
+
+def check_date_display():
+    """Verify date display logic exists."""
+    popup_js = OUTPUT_DIR / "popup.js"
+    if output_has("popup.js"):
+        content = read_cached(popup_js).lower()
+        has_date = any(x in content for x in DATE_MARKERS)
+        return has_date, "No date logic found"
+    return False, "popup.js missing"
+
+PHONE_HIGHLIGHT_PATTERNS = (
+    (re.compile(r'phone|PHONE|regex|RegExp|\d{3}', re.IGNORECASE), "Phone detection pattern"),
+    (re.compile(r'highlight|mark|style|background', re.IGNORECASE), "Highlighting logic"),
+)
+PHONE_REGEX_MARKERS = ('\\d{3}', 'PHONE', 'phone', '[0-9]')
+
+# SCENARIO 2 (FROM ASSIGNMENT):
+# "Make an extension that highlights all phone numbers on any website."
+# → Requires content.js + permissions
+def check_content_js():
+    path = OUTPUT_DIR / "content.js"
+    valid, errors = validate_js(path, PHONE_HIGHLIGHT_PATTERNS)
+    return valid, "; ".join(errors) if errors else ""
+
+def check_manifest_content_scripts():
+    manifest = load_manifest()
+    has_cs = "content_scripts" in manifest
+    return has_cs, "Missing content_scripts"
+
+def check_permissions():
+    manifest = load_manifest()
+    perms = manifest.get("permissions", [])
+    has_active = "activeTab" in perms or any("http" in str(p) for p in manifest.get("host_permissions", []))
+    return has_active, "Missing activeTab or host_permissions"
+
+def check_phone_regex():
+    """Verify phone number regex exists."""
+    content_js = OUTPUT_DIR / "content.js"
+    if output_has("content.js"):
+        content = read_cached(content_js)
+        has_regex = any(x in content for x in PHONE_REGEX_MARKERS)
+        return has_regex, "No phone regex found"
+    return False, "content.js missing"
+
+SITE_BLOCKING_PATTERNS = (
+    (re.compile(r'facebook|tiktok', re.IGNORECASE), "Site blocking targets"),
+    (re.compile(r'block|Block|declarativeNetRequest|webRequest', re.IGNORECASE), "Blocking logic"),
+)
+
+# SCENARIO 3 (FROM ASSIGNMENT):
+# "Block Facebook and TikTok every time the browser opens."
+# → Requires background.js with webRequestBlocking permissions
+def check_background_js():
+    path = OUTPUT_DIR / "background.js"
+    if not output_has("background.js"):
+        return False, "background.js missing"
+    valid, errors = validate_js(path, SITE_BLOCKING_PATTERNS)
+    return valid, "; ".join(errors) if errors else ""
+
+def check_manifest_background():
+    manifest = load_manifest()
+    has_bg = "background" in manifest and "service_worker" in manifest.get("background", {})
+    return has_bg, "Missing background.service_worker"
+
+def check_blocking_permissions():
+    manifest = load_manifest()
+    perms = manifest.get("permissions", [])
+    has_blocking = "declarativeNetRequest" in perms or "webRequest" in perms
+    return has_blocking, "Missing blocking permission (declarativeNetRequest or webRequest)"
+
+def check_rules_json():
+    """Check for declarativeNetRequest rules."""
+    manifest = load_manifest()
+    if "declarative_net_request" in manifest:
+        rules_path = OUTPUT_DIR / "rules.json"
+        if output_has("rules.json"):
+            try:
+                rules = json.loads(read_file(rules_path))
+                return len(rules) > 0, "Empty rules.json"
+            except:
+                return False, "Invalid rules.json"
+    return True, ""  # Optional if using dynamic rules
+
+def check_sites_blocked():
+    """Verify both sites are targeted."""
+    bg_js = OUTPUT_DIR / "background.js"
+    rules_json = OUTPUT_DIR / "rules.json"
+    
+    content = ""
+    if output_has("background.js"):
+        content += read_cached(bg_js).lower()
+    if output_has("rules.json"):
+        content += read_cached(rules_json).lower()
+    
+    has_fb = "facebook" in content
+    has_tt = "tiktok" in content
+    
+    if has_fb and has_tt:
+        return True, ""
+    missing = []
+    if not has_fb:
+        missing.append("facebook")
+    if not has_tt:
+        missing.append("tiktok")
+    return False, f"Missing: {', '.join(missing)}"
+
+COLOR_MARKERS = ('color', 'blue', 'style')  # matched against lowercased text
+SEND_MARKERS = ('sendMessage', 'tabs.sendMessage', 'chrome.tabs')
+RECEIVE_MARKERS = ('onMessage', 'addListener', 'chrome.runtime')
+CLICK_MARKERS = ('addEventListener', 'onclick', 'click')
+
+# SCENARIO 4 (FROM ASSIGNMENT):
+# "A tool that changes all webpage text to blue when I click a button in the popup."
+# → Requires popup + content script + message passing
+def check_popup_files():
+    return output_has("popup.html") and output_has("popup.js"), "Missing popup files"
+
+def check_content_script():
+    content_js = OUTPUT_DIR / "content.js"
+    if not output_has("content.js"):
+        return False, "content.js missing"
+    content = read_cached(content_js).lower()
+    has_color = any(x in content for x in COLOR_MARKERS)
+    return has_color, "No color change logic"
+
+def check_message_passing():
+    """Verify message passing between popup and content script."""
+    popup_js = OUTPUT_DIR / "popup.js"
+    content_js = OUTPUT_DIR / "content.js"
+    
+    popup_content = read_cached(popup_js) if output_has("popup.js") else ""
+    content_content = read_cached(content_js) if output_has("content.js") else ""
+    
+    # Check for sendMessage in popup
+    has_send = any(x in popup_content for x in SEND_MARKERS)
+    # Check for onMessage in content
+    has_receive = any(x in content_content for x in RECEIVE_MARKERS)
+    
+    if has_send and has_receive:
+        return True, ""
+    missing = []
+    if not has_send:
+        missing.append("sendMessage in popup.js")
+    if not has_receive:
+        missing.append("onMessage in content.js")
+    return False, f"Missing: {', '.join(missing)}"
+
+def check_button_click():
+    """Verify button click handler exists."""
+    popup_js = OUTPUT_DIR / "popup.js"
+    if output_has("popup.js"):
+        content = read_cached(popup_js)
+        has_click = any(x in content for x in CLICK_MARKERS)
+        return has_click, "No click handler found"
+    return False, "popup.js missing"
+
+# ============================================================================
+# PART A TESTS: PROMPT ANALYSIS ENGINE
+# ============================================================================
+
+# Test prompt validation (too short, too long, missing verbs).
+def check_manifest_exists():
+    return output_has("manifest.json"), "No manifest created"
+
+# Test UI interaction intent detection.
+def check_has_popup():
+    manifest = load_manifest()
+    return "action" in manifest, "UI intent not detected"
+
+# Test content modification intent detection.
+def check_has_content_script():
+    manifest = load_manifest()
+    return "content_scripts" in manifest, "Content intent not detected"
+
+# Test background automation intent detection.
+def check_has_background():
+    manifest = load_manifest()
+    return "background" in manifest, "Background intent not detected"
+
+# ============================================================================
+# PART B TESTS: MANIFEST BUILDER
+# ============================================================================
+
+# Test Manifest V3 compliance.
+def check_mv3():
+    manifest = load_manifest()
+    return manifest.get("manifest_version") == 3, f"Got MV{manifest.get('manifest_version')}"
+
+def check_required_fields():
+    manifest = load_manifest()
+    has_name = bool(manifest.get("name"))
+    has_version = bool(manifest.get("version"))
+    return has_name and has_version, "Missing name or version"
+
+# Test permission detection.
+def check_storage_perm():
+    manifest = load_manifest()
+    return "storage" in manifest.get("permissions", []), "storage permission not added"
+
+# Test host permissions for blocking.
+def check_host_perms():
+    manifest = load_manifest()
+    host_perms = manifest.get("host_permissions", [])
+    return len(host_perms) > 0 or "<all_urls>" in str(manifest), "No host permissions"
+
+# ============================================================================
+# PART C TESTS: DYNAMIC CODE GENERATION
+# ============================================================================
+
+# Test popup file generation.
+def check_popup_html_valid():
+    path = OUTPUT_DIR / "popup.html"
+    if not output_has("popup.html"):
+        return False, "popup.html not created"
+    valid, errors = validate_html(path)
+    return valid, "; ".join(errors)
+
+def check_popup_js_valid():
+    path = OUTPUT_DIR / "popup.js"
+    if not output_has("popup.js"):
+        return False, "popup.js not created"
+    valid, errors = validate_js(path)
+    return valid, "; ".join(errors)
+
+def check_styles_css():
+    return output_has("styles.css"), "styles.css not created"
+
+# Test content script generation.
+def check_content_js_valid():
+    path = OUTPUT_DIR / "content.js"
+    if not output_has("content.js"):
+        return False, "content.js not created"
+    valid, errors = validate_js(path)
+    return valid, "; ".join(errors)
+
+def check_iife_wrapper():
+    """Content scripts should be wrapped in IIFE."""
+    path = OUTPUT_DIR / "content.js"
+    if output_has("content.js"):
+        content = read_cached(path)
+        has_iife = "(function()" in content or "(() =>" in content
+        return has_iife, "Not wrapped in IIFE"
+    return False, "content.js missing"
+
+# Test background script generation.
+def check_background_js_valid():
+    path = OUTPUT_DIR / "background.js"
+    if not output_has("background.js"):
+        return False, "background.js not created"
+    valid, errors = validate_js(path)
+    return valid, "; ".join(errors)
+
+def check_service_worker_events():
+    """Background should have install/startup handlers."""
+    path = OUTPUT_DIR / "background.js"
+    if output_has("background.js"):
+        content = read_cached(path)
+        has_events = "onInstalled" in content or "onStartup" in content
+        return has_events, "Missing lifecycle event handlers"
+    return False, "background.js missing"
+
+# ============================================================================
+# PART D TESTS: FILE SYSTEM OUTPUT
+# ============================================================================
+
+# Test generated_extension folder creation.
+def check_folder_exists():
+    # is_dir() is false for a missing path, so one stat answers both
+    return OUTPUT_DIR.is_dir(), "Folder not created"
+
+def check_manifest_in_folder():
+    return output_has("manifest.json"), "manifest.json not in folder"
+
+# Test that extension is loadable in Chrome.
+def check_all_referenced_files():
+    """Verify all files referenced in manifest exist."""
+    manifest_path = OUTPUT_DIR / "manifest.json"
+    if not output_has("manifest.json"):
+        return False, "No manifest"
+    
+    manifest = load_manifest(manifest_path)
+    missing = []
+    
+    def exists(name):
+        return output_has(name) or (OUTPUT_DIR / name).exists()
+    
+    # Check popup
+    if "action" in manifest and "default_popup" in manifest["action"]:
+        if not exists(manifest["action"]["default_popup"]):
+            missing.append(manifest["action"]["default_popup"])
+    
+    # Check background
+    if "background" in manifest and "service_worker" in manifest["background"]:
+        if not exists(manifest["background"]["service_worker"]):
+            missing.append(manifest["background"]["service_worker"])
+    
+    # Check content scripts
+    for cs in manifest.get("content_scripts", []):
+        for js in cs.get("js", []):
+            if not exists(js):
+                missing.append(js)
+        for css in cs.get("css", []):
+            if not exists(css):
+                missing.append(css)
+    
+    if missing:
+        return False, f"Missing: {', '.join(missing)}"
+    return True, ""
+
+# ============================================================================
+# EDGE CASE TESTS
+# ============================================================================
+
+# Test handling of empty prompt.
+def check_creates_default():
+    return output_has("manifest.json"), "Should create default extension"
+
+# Test complex multi-feature prompt.
+def check_multiple_components():
+    manifest = load_manifest()
+    has_popup = "action" in manifest
+    has_content = "content_scripts" in manifest
+    return has_popup or has_content, "Should detect at least one component"
+
+# Test prompt with special characters.
+def check_manifest_valid():
+    manifest_path = OUTPUT_DIR / "manifest.json"
+    if not output_has("manifest.json"):
+        return False, "No manifest"
+    try:
+        load_manifest(manifest_path)
+        return True, ""
+    except:
+        return False, "Invalid JSON"
+
+# check_no_fetch scans every generated script, so compile its pattern once
+EXTERNAL_FETCH_RE = re.compile(r"fetch\s*\(\s*['\"]https?://(?!chrome)")
+
+# Verify no external API calls in generated code.
+def check_no_fetch():
+    """Generated code should not call external APIs."""
+    for file in OUTPUT_DIR.glob("*.js"):
+        content = read_cached(file)
+        # Allow chrome.* APIs but not external fetch to non-Chrome URLs
+        has_external = EXTERNAL_FETCH_RE.search(content)
+        if has_external:
+            return False, f"External API call in {file.name}"
+    return True, ""
+
+# ============================================================================
+# SCENARIO TABLE - run in order, numbered from 1
+# ============================================================================
+
+TESTS = [
+    # === ASSIGNMENT SCENARIOS ===
+    {
+        "name": "ASSIGNMENT SCENARIO 1: Popup with Date",
+        "prompt": "Create an extension that shows a popup with today's date.",
+        "checks": [
             ("popup.html exists and valid", check_popup_html),
             ("popup.js exists with date logic", check_popup_js),
             ("manifest.json has action.default_popup", check_manifest_action),
             ("Date display functionality present", check_date_display),
-        ]
-    )
-
-def test_scenario_2():
-    """
-    SCENARIO 2 (FROM ASSIGNMENT):
-    "Make an extension that highlights all phone numbers on any website."
-    → Requires content.js + permissions
-    """
-    def check_content_js():
-        path = OUTPUT_DIR / "content.js"
-        patterns = [
-            (r'phone|PHONE|regex|RegExp|\d{3}', "Phone detection pattern"),
-            (r'highlight|mark|style|background', "Highlighting logic"),
-        ]
-        valid, errors = validate_js(path, patterns)
-        return valid, "; ".join(errors) if errors else ""
-    
-    def check_manifest_content_scripts():
-        manifest = json.load(open(OUTPUT_DIR / "manifest.json"))
-        has_cs = "content_scripts" in manifest
-        return has_cs, "Missing content_scripts"
-    
-    def check_permissions():
-        manifest = json.load(open(OUTPUT_DIR / "manifest.json"))
-        perms = manifest.get("permissions", [])
-        has_active = "activeTab" in perms or any("http" in str(p) for p in manifest.get("host_permissions", []))
-        return has_active, "Missing activeTab or host_permissions"
-    
-    def check_phone_regex():
-        """Verify phone number regex exists."""
-        content_js = OUTPUT_DIR / "content.js"
-        if content_js.exists():
-            content = content_js.read_text()
-            has_regex = any(x in content for x in ['\\d{3}', 'PHONE', 'phone', '[0-9]'])
-            return has_regex, "No phone regex found"
-        return False, "content.js missing"
-    
-    return test_scenario(
-        2, 20, "ASSIGNMENT SCENARIO 2: Highlight Phone Numbers",
-        "Make an extension that highlights all phone numbers on any website.",
-        [
+        ],
+    },
+    {
+        "name": "ASSIGNMENT SCENARIO 2: Highlight Phone Numbers",
+        "prompt": "Make an extension that highlights all phone numbers on any website.",
+        "checks": [
             ("content.js exists with phone logic", check_content_js),
             ("manifest.json has content_scripts", check_manifest_content_scripts),
             ("Has required permissions", check_permissions),
             ("Phone number regex present", check_phone_regex),
-        ]
-    )
-
-def test_scenario_3():
-    """
-    SCENARIO 3 (FROM ASSIGNMENT):
-    "Block Facebook and TikTok every time the browser opens."
-    → Requires background.js with webRequestBlocking permissions
-    """
-    def check_background_js():
-        path = OUTPUT_DIR / "background.js"
-        if not path.exists():
-            return False, "background.js missing"
-        patterns = [
-            (r'facebook|tiktok', "Site blocking targets"),
-            (r'block|Block|declarativeNetRequest|webRequest', "Blocking logic"),
-        ]
-        valid, errors = validate_js(path, patterns)
-        return valid, "; ".join(errors) if errors else ""
-    
-    def check_manifest_background():
-        manifest = json.load(open(OUTPUT_DIR / "manifest.json"))
-        has_bg = "background" in manifest and "service_worker" in manifest.get("background", {})
-        return has_bg, "Missing background.service_worker"
-    
-    def check_blocking_permissions():
-        manifest = json.load(open(OUTPUT_DIR / "manifest.json"))
-        perms = manifest.get("permissions", [])
-        has_blocking = "declarativeNetRequest" in perms or "webRequest" in perms
-        return has_blocking, "Missing blocking permission (declarativeNetRequest or webRequest)"
-    
-    def check_rules_json():
-        """Check for declarativeNetRequest rules."""
-        manifest = json.load(open(OUTPUT_DIR / "manifest.json"))
-        if "declarative_net_request" in manifest:
-            rules_path = OUTPUT_DIR / "rules.json"
-            if rules_path.exists():
-                try:
-                    rules = json.load(open(rules_path))
-                    return len(rules) > 0, "Empty rules.json"
-                except:
-                    return False, "Invalid rules.json"
-        return True, ""  # Optional if using dynamic rules
-    
-    def check_sites_blocked():
-        """Verify both sites are targeted."""
-        bg_js = OUTPUT_DIR / "background.js"
-        rules_json = OUTPUT_DIR / "rules.json"
-        
-        content = ""
-        if bg_js.exists():
-            content += bg_js.read_text().lower()
-        if rules_json.exists():
-            content += rules_json.read_text().lower()
-        
-        has_fb = "facebook" in content
-        has_tt = "tiktok" in content
-        
-        if has_fb and has_tt:
-            return True, ""
-        missing = []
-        if not has_fb:
-            missing.append("facebook")
-        if not has_tt:
-            missing.append("tiktok")
-        return False, f"Missing: {', '.join(missing)}"
-    
-    return test_scenario(
-        3, 20, "ASSIGNMENT SCENARIO 3: Block Facebook & TikTok",
-        "Block Facebook and TikTok every time the browser opens.",
-        [
+        ],
+    },
+    {
+        "name": "ASSIGNMENT SCENARIO 3: Block Facebook & TikTok",
+        "prompt": "Block Facebook and TikTok every time the browser opens.",
+        "checks": [
             ("background.js exists with blocking", check_background_js),
             ("manifest.json has service_worker", check_manifest_background),
             ("Has blocking permissions", check_blocking_permissions),
             ("rules.json valid (if used)", check_rules_json),
             ("Both sites targeted", check_sites_blocked),
-        ]
-    )
-
-def test_scenario_4():
-    """
-    SCENARIO 4 (FROM ASSIGNMENT):
-    "A tool that changes all webpage text to blue when I click a button in the popup."
-    → Requires popup + content script + message passing
-    """
-    def check_popup_files():
-        popup_html = OUTPUT_DIR / "popup.html"
-        popup_js = OUTPUT_DIR / "popup.js"
-        return popup_html.exists() and popup_js.exists(), "Missing popup files"
-    
-    def check_content_script():
-        content_js = OUTPUT_DIR / "content.js"
-        if not content_js.exists():
-            return False, "content.js missing"
-        content = content_js.read_text()
-        has_color = any(x in content.lower() for x in ['color', 'blue', 'style'])
-        return has_color, "No color change logic"
-    
-    def check_message_passing():
-        """Verify message passing between popup and content script."""
-        popup_js = OUTPUT_DIR / "popup.js"
-        content_js = OUTPUT_DIR / "content.js"
-        
-        popup_content = popup_js.read_text() if popup_js.exists() else ""
-        content_content = content_js.read_text() if content_js.exists() else ""
-        
-        # Check for sendMessage in popup
-        has_send = any(x in popup_content for x in ['sendMessage', 'tabs.sendMessage', 'chrome.tabs'])
-        # Check for onMessage in content
-        has_receive = any(x in content_content for x in ['onMessage', 'addListener', 'chrome.runtime'])
-        
-        if has_send and has_receive:
-            return True, ""
-        missing = []
-        if not has_send:
-            missing.append("sendMessage in popup.js")
-        if not has_receive:
-            missing.append("onMessage in content.js")
-        return False, f"Missing: {', '.join(missing)}"
-    
-    def check_button_click():
-        """Verify button click handler exists."""
-        popup_js = OUTPUT_DIR / "popup.js"
-        if popup_js.exists():
-            content = popup_js.read_text()
-            has_click = any(x in content for x in ['addEventListener', 'onclick', 'click'])
-            return has_click, "No click handler found"
-        return False, "popup.js missing"
-    
-    return test_scenario(
-        4, 20, "ASSIGNMENT SCENARIO 4: Change Text to Blue",
-        "A tool that changes all webpage text to blue when I click a button in the popup.",
-        [
+        ],
+    },
+    {
+        "name": "ASSIGNMENT SCENARIO 4: Change Text to Blue",
+        "prompt": "A tool that changes all webpage text to blue when I click a button in the popup.",
+        "checks": [
             ("popup.html and popup.js exist", check_popup_files),
             ("content.js has color logic", check_content_script),
             ("Message passing implemented", check_message_passing),
             ("Button click handler exists", check_button_click),
-        ]
-    )
-
-# ============================================================================
-# PART A TESTS: PROMPT ANALYSIS ENGINE
-# ============================================================================
-
-def test_part_a_validation():
-    """Test prompt validation (too short, too long, missing verbs)."""
-    def check_manifest_exists():
-        return (OUTPUT_DIR / "manifest.json").exists(), "No manifest created"
-    
-    return test_scenario(
-        5, 20, "PART A: Prompt Validation - Short Prompt",
-        "hi",  # Too short
-        [
+        ],
+    },
+    
+    # === PART A: PROMPT ANALYSIS ENGINE ===
+    {
+        "name": "PART A: Prompt Validation - Short Prompt",
+        "prompt": "hi",  # Too short
+        "checks": [
             ("Should still create manifest", check_manifest_exists),
-        ]
-    )
-
-def test_part_a_intent_ui():
-    """Test UI interaction intent detection."""
-    def check_has_popup():
-        manifest = json.load(open(OUTPUT_DIR / "manifest.json"))
-        return "action" in manifest, "UI intent not detected"
-    
-    return test_scenario(
-        6, 20, "PART A: Intent Detection - UI Interaction",
-        "Show a popup with a button that displays Hello World",
-        [
+        ],
+    },
+    {
+        "name": "PART A: Intent Detection - UI Interaction",
+        "prompt": "Show a popup with a button that displays Hello World",
+        "checks": [
             ("Detects popup requirement", check_has_popup),
-        ]
-    )
-
-def test_part_a_intent_content():
-    """Test content modification intent detection."""
-    def check_has_content_script():
-        manifest = json.load(open(OUTPUT_DIR / "manifest.json"))
-        return "content_scripts" in manifest, "Content intent not detected"
-    
-    return test_scenario(
-        7, 20, "PART A: Intent Detection - Content Modification",
-        "Highlight all email addresses on every webpage I visit",
-        [
+        ],
+    },
+    {
+        "name": "PART A: Intent Detection - Content Modification",
+        "prompt": "Highlight all email addresses on every webpage I visit",
+        "checks": [
             ("Detects content_scripts requirement", check_has_content_script),
-        ]
-    )
-
-def test_part_a_intent_background():
-    """Test background automation intent detection."""
-    def check_has_background():
-        manifest = json.load(open(OUTPUT_DIR / "manifest.json"))
-        return "background" in manifest, "Background intent not detected"
-    
-    return test_scenario(
-        8, 20, "PART A: Intent Detection - Background Automation",
-        "Block all social media sites automatically when the browser opens",
-        [
+        ],
+    },
+    {
+        "name": "PART A: Intent Detection - Background Automation",
+        "prompt": "Block all social media sites automatically when the browser opens",
+        "checks": [
             ("Detects background requirement", check_has_background),
-        ]
-    )
-
-# ============================================================================
-# PART B TESTS: MANIFEST BUILDER
-# ============================================================================
-
-def test_part_b_manifest_v3():
-    """Test Manifest V3 compliance."""
-    def check_mv3():
-        manifest = json.load(open(OUTPUT_DIR / "manifest.json"))
-        return manifest.get("manifest_version") == 3, f"Got MV{manifest.get('manifest_version')}"
-    
-    def check_required_fields():
-        manifest = json.load(open(OUTPUT_DIR / "manifest.json"))
-        has_name = bool(manifest.get("name"))
-        has_version = bool(manifest.get("version"))
-        return has_name and has_version, "Missing name or version"
-    
-    return test_scenario(
-        9, 20, "PART B: Manifest V3 Compliance",
-        "Create a simple extension with a popup",
-        [
+        ],
+    },
+    
+    # === PART B: MANIFEST BUILDER ===
+    {
+        "name": "PART B: Manifest V3 Compliance",
+        "prompt": "Create a simple extension with a popup",
+        "checks": [
             ("manifest_version is 3", check_mv3),
             ("Has name and version", check_required_fields),
-        ]
-    )
-
-def test_part_b_permissions():
-    """Test permission detection."""
-    def check_storage_perm():
-        manifest = json.load(open(OUTPUT_DIR / "manifest.json"))
-        return "storage" in manifest.get("permissions", []), "storage permission not added"
-    
-    return test_scenario(
-        10, 20, "PART B: Permission Detection",
-        "Create an extension that saves notes to local storage",
-        [
+        ],
+    },
+    {
+        "name": "PART B: Permission Detection",
+        "prompt": "Create an extension that saves notes to local storage",
+        "checks": [
             ("Detects storage permission", check_storage_perm),
-        ]
-    )
-
-def test_part_b_host_permissions():
-    """Test host permissions for blocking."""
-    def check_host_perms():
-        manifest = json.load(open(OUTPUT_DIR / "manifest.json"))
-        host_perms = manifest.get("host_permissions", [])
-        return len(host_perms) > 0 or "<all_urls>" in str(manifest), "No host permissions"
-    
-    return test_scenario(
-        11, 20, "PART B: Host Permissions",
-        "Block access to twitter.com and instagram.com",
-        [
+        ],
+    },
+    {
+        "name": "PART B: Host Permissions",
+        "prompt": "Block access to twitter.com and instagram.com",
+        "checks": [
             ("Has host permissions for blocking", check_host_perms),
-        ]
-    )
-
-# ============================================================================
-# PART C TESTS: DYNAMIC CODE GENERATION
-# ============================================================================
-
-def test_part_c_popup_files():
-    """Test popup file generation."""
-    def check_popup_html_valid():
-        path = OUTPUT_DIR / "popup.html"
-        if not path.exists():
-            return False, "popup.html not created"
-        valid, errors = validate_html(path)
-        return valid, "; ".join(errors)
-    
-    def check_popup_js_valid():
-        path = OUTPUT_DIR / "popup.js"
-        if not path.exists():
-            return False, "popup.js not created"
-        valid, errors = validate_js(path)
-        return valid, "; ".join(errors)
-    
-    def check_styles_css():
-        path = OUTPUT_DIR / "styles.css"
-        return path.exists(), "styles.css not created"
-    
-    return test_scenario(
-        12, 20, "PART C: Popup File Generation",
-        "Create a popup that shows the current time",
-        [
+        ],
+    },
+    
+    # === PART C: DYNAMIC CODE GENERATION ===
+    {
+        "name": "PART C: Popup File Generation",
+        "prompt": "Create a popup that shows the current time",
+        "checks": [
             ("popup.html is valid HTML", check_popup_html_valid),
             ("popup.js is valid JavaScript", check_popup_js_valid),
             ("styles.css exists", check_styles_css),
-        ]
-    )
-
-def test_part_c_content_script():
-    """Test content script generation."""
-    def check_content_js_valid():
-        path = OUTPUT_DIR / "content.js"
-        if not path.exists():
-            return False, "content.js not created"
-        valid, errors = validate_js(path)
-        return valid, "; ".join(errors)
-    
-    def check_iife_wrapper():
-        """Content scripts should be wrapped in IIFE."""
-        path = OUTPUT_DIR / "content.js"
-        if path.exists():
-            content = path.read_text()
-            has_iife = "(function()" in content or "(() =>" in content
-            return has_iife, "Not wrapped in IIFE"
-        return False, "content.js missing"
-    
-    return test_scenario(
-        13, 20, "PART C: Content Script Generation",
-        "Find and highlight all links on any webpage",
-        [
+        ],
+    },
+    {
+        "name": "PART C: Content Script Generation",
+        "prompt": "Find and highlight all links on any webpage",
+        "checks": [
             ("content.js is valid JavaScript", check_content_js_valid),
             ("Uses IIFE wrapper for isolation", check_iife_wrapper),
-        ]
-    )
-
-def test_part_c_background_script():
-    """Test background script generation."""
-    def check_background_js_valid():
-        path = OUTPUT_DIR / "background.js"
-        if not path.exists():
-            return False, "background.js not created"
-        valid, errors = validate_js(path)
-        return valid, "; ".join(errors)
-    
-    def check_service_worker_events():
-        """Background should have install/startup handlers."""
-        path = OUTPUT_DIR / "background.js"
-        if path.exists():
-            content = path.read_text()
-            has_events = "onInstalled" in content or "onStartup" in content
-            return has_events, "Missing lifecycle event handlers"
-        return False, "background.js missing"
-    
-    return test_scenario(
-        14, 20, "PART C: Background Script Generation",
-        "Create an alarm that fires every 5 minutes",
-        [
+        ],
+    },
+    {
+        "name": "PART C: Background Script Generation",
+        "prompt": "Create an alarm that fires every 5 minutes",
+        "checks": [
             ("background.js is valid JavaScript", check_background_js_valid),
             ("Has lifecycle event handlers", check_service_worker_events),
-        ]
-    )
-
-# ============================================================================
-# PART D TESTS: FILE SYSTEM OUTPUT
-# ============================================================================
-
-def test_part_d_folder_creation():
-    """Test generated_extension folder creation."""
-    def check_folder_exists():
-        return OUTPUT_DIR.exists() and OUTPUT_DIR.is_dir(), "Folder not created"
-    
-    def check_manifest_in_folder():
-        return (OUTPUT_DIR / "manifest.json").exists(), "manifest.json not in folder"
-    
-    return test_scenario(
-        15, 20, "PART D: Folder Creation",
-        "Create any simple extension",
-        [
+        ],
+    },
+    
+    # === PART D: FILE SYSTEM OUTPUT ===
+    {
+        "name": "PART D: Folder Creation",
+        "prompt": "Create any simple extension",
+        "checks": [
             ("generated_extension/ folder created", check_folder_exists),
             ("manifest.json in folder", check_manifest_in_folder),
-        ]
-    )
-
-def test_part_d_loadable():
-    """Test that extension is loadable in Chrome."""
-    def check_all_referenced_files():
-        """Verify all files referenced in manifest exist."""
-        manifest_path = OUTPUT_DIR / "manifest.json"
-        if not manifest_path.exists():
-            return False, "No manifest"
-        
-        manifest = json.load(open(manifest_path))
-        missing = []
-        
-        # Check popup
-        if "action" in manifest and "default_popup" in manifest["action"]:
-            popup = OUTPUT_DIR / manifest["action"]["default_popup"]
-            if not popup.exists():
-                missing.append(manifest["action"]["default_popup"])
-        
-        # Check background
-        if "background" in manifest and "service_worker" in manifest["background"]:
-            bg = OUTPUT_DIR / manifest["background"]["service_worker"]
-            if not bg.exists():
-                missing.append(manifest["background"]["service_worker"])
-        
-        # Check content scripts
-        for cs in manifest.get("content_scripts", []):
-            for js in cs.get("js", []):
-                if not (OUTPUT_DIR / js).exists():
-                    missing.append(js)
-            for css in cs.get("css", []):
-                if not (OUTPUT_DIR / css).exists():
-                    missing.append(css)
-        
-        if missing:
-            return False, f"Missing: {', '.join(missing)}"
-        return True, ""
-    
-    return test_scenario(
-        16, 20, "PART D: Chrome Loadable",
-        "Create a complete extension with popup and content script",
-        [
+        ],
+    },
+    {
+        # End to end through the command line: __main__, sys.exit(main())
+        # and a fresh module state
+        "name": "PART D: Chrome Loadable",
+        "prompt": "Create a complete extension with popup and content script",
+        "cli": True,
+        "checks": [
             ("All referenced files exist", check_all_referenced_files),
-        ]
-    )
-
-# ============================================================================
-# EDGE CASE TESTS
-# ============================================================================
-
-def test_edge_empty_prompt():
-    """Test handling of empty prompt."""
-    def check_creates_default():
-        return (OUTPUT_DIR / "manifest.json").exists(), "Should create default extension"
-    
-    return test_scenario(
-        17, 20, "EDGE CASE: Empty Prompt",
-        "",  # Empty
-        [
+        ],
+    },
+    
+    # === EDGE CASES ===
+    {
+        "name": "EDGE CASE: Empty Prompt",
+        "prompt": "",  # Empty
+        "checks": [
             ("Creates default extension", check_creates_default),
-        ]
-    )
-
-def test_edge_complex_prompt():
-    """Test complex multi-feature prompt."""
-    def check_multiple_components():
-        manifest = json.load(open(OUTPUT_DIR / "manifest.json"))
-        has_popup = "action" in manifest
-        has_content = "content_scripts" in manifest
-        return has_popup or has_content, "Should detect at least one component"
-    
-    return test_scenario(
-        18, 20, "EDGE CASE: Complex Prompt",
-        "Create an extension with a popup button that when clicked highlights all emails on the page and saves them to storage",
-        [
+        ],
+    },
+    {
+        "name": "EDGE CASE: Complex Prompt",
+        "prompt": "Create an extension with a popup button that when clicked highlights all emails on the page and saves them to storage",
+        "checks": [
             ("Handles complex multi-feature request", check_multiple_components),
-        ]
-    )
-
-def test_edge_special_chars():
-    """Test prompt with special characters."""
-    def check_manifest_valid():
-        manifest_path = OUTPUT_DIR / "manifest.json"
-        if not manifest_path.exists():
-            return False, "No manifest"
-        try:
-            json.load(open(manifest_path))
-            return True, ""
-        except:
-            return False, "Invalid JSON"
-    
-    return test_scenario(
-        19, 20, "EDGE CASE: Special Characters",
-        "Create an extension that shows \"today's date\" & <time>!",
-        [
+        ],
+    },
+    {
+        "name": "EDGE CASE: Special Characters",
+        "prompt": "Create an extension that shows \"today's date\" & <time>!",
+        "checks": [
             ("Handles special chars in manifest", check_manifest_valid),
-        ]
-    )
-
-def test_no_external_apis():
-    """Verify no external API calls in generated code."""
-    def check_no_fetch():
-        """Generated code should not call external APIs."""
-        for file in OUTPUT_DIR.glob("*.js"):
-            content = file.read_text()
-            # Allow chrome.* APIs but not external fetch to non-Chrome URLs
-            has_external = re.search(r"fetch\s*\(\s*['\"]https?://(?!chrome)", content)
-            if has_external:
-                return False, f"External API call in {file.name}"
-        return True, ""
-    
-    return test_scenario(
-        20, 20, "REQUIREMENT: No External APIs",
-        "Create a popup that shows the date",
-        [
+        ],
+    },
+    
+    # === REQUIREMENTS ===
+    {
+        "name": "REQUIREMENT: No External APIs",
+        "prompt": "Create a popup that shows the date",
+        "checks": [
             ("No external API calls in generated code", check_no_fetch),
-        ]
-    )
+        ],
+    },
+]
 
 # ============================================================================
 # MAIN TEST RUNNER
@@ -875,43 +969,22 @@ def main():
     
     # Check for syntax errors
     print(f"\n{C.Y}[PRE-CHECK]{C.RESET} Validating chrome_forge.py syntax...")
-    result = subprocess.run(["python3", "-m", "py_compile", str(SCRIPT_PATH)], capture_output=True)
-    if result.returncode != 0:
+    try:
+        py_compile.compile(str(SCRIPT_PATH), doraise=True)
+    except py_compile.PyCompileError as e:
         print(f"{C.R}✗ SYNTAX ERROR in chrome_forge.py{C.RESET}")
-        print(result.stderr.decode())
+        print(e.msg)
         return 1
     print(f"{C.G}✓ No syntax errors{C.RESET}")
     
     # Run all tests
-    tests = [
-        test_scenario_1,    # Assignment Scenario 1
-        test_scenario_2,    # Assignment Scenario 2
-        test_scenario_3,    # Assignment Scenario 3
-        test_scenario_4,    # Assignment Scenario 4
-        test_part_a_validation,
-        test_part_a_intent_ui,
-        test_part_a_intent_content,
-        test_part_a_intent_background,
-        test_part_b_manifest_v3,
-        test_part_b_permissions,
-        test_part_b_host_permissions,
-        test_part_c_popup_files,
-        test_part_c_content_script,
-        test_part_c_background_script,
-        test_part_d_folder_creation,
-        test_part_d_loadable,
-        test_edge_empty_prompt,
-        test_edge_complex_prompt,
-        test_edge_special_chars,
-        test_no_external_apis,
-    ]
-    
     passed = 0
     failed = 0
     
-    for test in tests:
+    for test_num, test in enumerate(TESTS, 1):
         try:
-            if test():
+            if test_scenario(test_num, len(TESTS), test["name"], test["prompt"], test["checks"],
+                             cli=test.get("cli", False)):
                 passed += 1
             else:
                 failed += 1
@@ -12,24 +12,36 @@ Run: python3 test_chrome_forge.py
 """
 
 import os
+import io
 import sys
 import json
+import contextlib
 import subprocess
+import py_compile
 import shutil
 from pathlib import Path
 
-# Terminal colors
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-BLUE = '\033[94m'
-BOLD = '\033[1m'
-RESET = '\033[0m'
+# Terminal colors, only on an interactive terminal and never under NO_COLOR
+_COLOR = sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+GREEN = '\033[92m' if _COLOR else ''
+RED = '\033[91m' if _COLOR else ''
+YELLOW = '\033[93m' if _COLOR else ''
+BLUE = '\033[94m' if _COLOR else ''
+BOLD = '\033[1m' if _COLOR else ''
+RESET = '\033[0m' if _COLOR else ''
 
 SCRIPT_DIR = Path(__file__).parent
 GENERATOR = SCRIPT_DIR / "chrome_forge.py"
 OUTPUT_DIR = SCRIPT_DIR / "generated_extension"
 
+# Load the generator once and call its main() per case; if it doesn't import,
+# fall back to a subprocess per case and let the pre-check report why
+sys.path.insert(0, str(SCRIPT_DIR))
+try:
+    import chrome_forge
+except Exception:
+    chrome_forge = None
+
 # ============================================================================
 # TEST CASES - Based on JSON Specification
 # ============================================================================
@@ -214,21 +226,96 @@ TEST_CASES = [
     },
     
     # === SCENARIO 14: Multiple blocked sites ===
+    # Run as a real command in a fresh interpreter, so __main__ and
+    # sys.exit(main()) stay covered
     {
         "id": 14,
         "name": "Block multiple sites",
         "prompt": "Block Facebook, Twitter, and Instagram.",
+        "cli": True,
         "expect_files": ["manifest.json", "background.js"],
         "manifest_checks": {
             "manifest_version": 3,
             "background.service_worker": "background.js",
         },
     },
+    
+    # === SCENARIO 15: Site name only inside another word ===
+    {
+        "id": 15,
+        "name": "No blocking for a site name inside a word",
+        "prompt": "Block all subreddits about cats",
+        "expect_files": ["manifest.json", "background.js"],
+        "expect_no_files": ["rules.json"],
+        "manifest_checks": {
+            "manifest_version": 3,
+            "declarative_net_request": lambda v: v is None,
+            "host_permissions": lambda v: v is None or not any("reddit" in h for h in v),
+        },
+    },
 ]
 
+# How a manifest_checks value is applied: called on the value, value must
+# exist, or value must equal it
+CHECK_CALL, CHECK_EXISTS, CHECK_EQUALS = range(3)
+
+
+def _check_kind(expected) -> int:
+    if callable(expected):
+        return CHECK_CALL
+    if expected is True:
+        return CHECK_EXISTS
+    return CHECK_EQUALS
+
+
+# Split the dotted manifest_checks keys, tag each with its kind and lowercase
+# the content_checks strings once, at import, rather than per run
+for _test in TEST_CASES:
+    _test["manifest_checks_compiled"] = [
+        (key, tuple(key.split('.')), _check_kind(expected), expected)
+        for key, expected in _test.get("manifest_checks", {}).items()
+    ]
+    _test["content_checks_compiled"] = {
+        fname: [(item, item.lower().encode()) for item in must_contain]
+        for fname, must_contain in _test.get("content_checks", {}).items()
+    }
+
 
 def run_generator(prompt: str) -> bool:
     """Run chrome_forge.py with the given prompt."""
+    if chrome_forge is None:
+        return run_generator_subprocess(prompt)
+    
+    # The same argv and stdin the subprocess got, plus --fast; the screen
+    # output is captured rather than shown, as before. Each run starts
+    # without the previous case's cached analyses
+    chrome_forge._analyze_cached.cache_clear()
+    saved = sys.stdin, sys.stdout, sys.argv
+    sys.stdin = io.StringIO("")
+    sys.stdout = io.StringIO()
+    sys.argv = [str(GENERATOR)] + ([prompt] if prompt else []) + ["--fast"]
+    error = None
+    try:
+        returncode = chrome_forge.main()
+    except SystemExit as e:
+        # sys.exit() inside main() must fail this case, not end the suite
+        returncode = 0 if e.code is None else e.code
+    except Exception as e:
+        error = e
+    finally:
+        sys.stdin, sys.stdout, sys.argv = saved
+    
+    if error is not None:
+        print(f"    {RED}Exception: {error}{RESET}")
+        return False
+    if returncode != 0:
+        print(f"    {RED}Generator failed with code {returncode}{RESET}")
+        return False
+    return True
+
+
+def run_generator_subprocess(prompt: str) -> bool:
+    """Run chrome_forge.py with the given prompt in a fresh interpreter."""
     try:
         cmd = [sys.executable, str(GENERATOR)]
         if prompt:
@@ -253,34 +340,30 @@ def run_generator(prompt: str) -> bool:
         return False
 
 
-def validate_json(filepath: Path) -> tuple:
-    """Validate JSON file."""
+def validate_json(raw: bytes) -> tuple:
+    """Validate JSON file contents."""
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = json.loads(raw)
         return True, data
     except json.JSONDecodeError as e:
         return False, str(e)
 
 
-def check_manifest(manifest: dict, checks: dict) -> list:
-    """Check manifest against expected values."""
+def check_manifest(manifest: dict, checks: list) -> list:
+    """Check manifest against (key, key parts, kind, expected) checks."""
     errors = []
-    for key, expected in checks.items():
+    for key, parts, kind, expected in checks:
         # Handle nested keys
-        parts = key.split('.')
         val = manifest
         for part in parts:
-            if isinstance(val, dict) and part in val:
-                val = val[part]
-            else:
-                val = None
+            val = val.get(part) if isinstance(val, dict) else None
+            if val is None:
                 break
         
-        if callable(expected):
+        if kind == CHECK_CALL:
             if not expected(val):
                 errors.append(f"manifest[{key}] failed custom check (value: {val})")
-        elif expected is True:
+        elif kind == CHECK_EXISTS:
             if val is None:
                 errors.append(f"manifest[{key}] expected to exist but missing")
         elif val != expected:
@@ -288,15 +371,16 @@ def check_manifest(manifest: dict, checks: dict) -> list:
     return errors
 
 
-def check_file_content(filepath: Path, must_contain: list) -> list:
-    """Check file contains required strings."""
-    if not filepath.exists():
-        return [f"File {filepath.name} does not exist"]
-    content = filepath.read_text()
+def check_file_content(files: dict, fname: str, must_contain: list) -> list:
+    """Check a generated file contains (string, lowercased bytes) needles."""
+    content = files.get(fname)
+    if content is None:
+        return [f"File {fname} does not exist"]
+    content_lc = content.lower()
     missing = []
-    for item in must_contain:
-        if item.lower() not in content.lower():
-            missing.append(f"'{item}' not found in {filepath.name}")
+    for item, needle in must_contain:
+        if needle not in content_lc:
+            missing.append(f"'{item}' not found in {fname}")
     return missing
 
 
@@ -309,34 +393,41 @@ def run_test(test: dict) -> tuple:
         shutil.rmtree(OUTPUT_DIR)
     
     # Run generator
-    if not run_generator(test["prompt"]):
+    run = run_generator_subprocess if test.get("cli") else run_generator
+    if not run(test["prompt"]):
         return False, ["Generator execution failed"]
     
     # Check output directory exists
     if not OUTPUT_DIR.exists():
         return False, ["Output directory not created"]
     
+    # Read every generated file once; the existence, content, JS and HTML
+    # checks below all work from these bytes
+    files = {}
+    with os.scandir(OUTPUT_DIR) as entries:
+        for entry in entries:
+            if entry.is_file():
+                with open(entry.path, 'rb') as f:
+                    files[entry.name] = f.read()
+    
     # Check expected files exist
     for fname in test.get("expect_files", []):
-        fpath = OUTPUT_DIR / fname
-        if not fpath.exists():
+        if fname not in files:
             errors.append(f"Expected file missing: {fname}")
     
     # Check unexpected files do NOT exist
     for fname in test.get("expect_no_files", []):
-        fpath = OUTPUT_DIR / fname
-        if fpath.exists():
+        if fname in files:
             errors.append(f"Unexpected file present: {fname}")
     
     # Validate manifest.json
-    manifest_path = OUTPUT_DIR / "manifest.json"
-    if manifest_path.exists():
-        valid, data = validate_json(manifest_path)
+    if "manifest.json" in files:
+        valid, data = validate_json(files["manifest.json"])
         if not valid:
             errors.append(f"manifest.json invalid JSON: {data}")
         else:
             # Check manifest fields
-            manifest_errors = check_manifest(data, test.get("manifest_checks", {}))
+            manifest_errors = check_manifest(data, test["manifest_checks_compiled"])
             errors.extend(manifest_errors)
             
             # CRITICAL: manifest_version MUST be 3
@@ -352,26 +443,27 @@ def run_test(test: dict) -> tuple:
         errors.append("manifest.json not found")
     
     # Check file contents
-    for fname, must_contain in test.get("content_checks", {}).items():
-        fpath = OUTPUT_DIR / fname
-        content_errors = check_file_content(fpath, must_contain)
+    for fname, must_contain in test["content_checks_compiled"].items():
+        content_errors = check_file_content(files, fname, must_contain)
         errors.extend(content_errors)
     
     # Validate JS files have balanced braces
-    for js_file in OUTPUT_DIR.glob("*.js"):
-        content = js_file.read_text()
-        if content.count('{') != content.count('}'):
-            errors.append(f"{js_file.name}: Unbalanced curly braces")
-        if content.count('(') != content.count(')'):
-            errors.append(f"{js_file.name}: Unbalanced parentheses")
+    for fname, content in files.items():
+        if not fname.endswith(".js"):
+            continue
+        if content.count(b'{') != content.count(b'}'):
+            errors.append(f"{fname}: Unbalanced curly braces")
+        if content.count(b'(') != content.count(b')'):
+            errors.append(f"{fname}: Unbalanced parentheses")
     
     # Validate HTML files
-    for html_file in OUTPUT_DIR.glob("*.html"):
-        content = html_file.read_text()
-        if "<!DOCTYPE html>" not in content and "<!doctype html>" not in content:
-            errors.append(f"{html_file.name}: Missing DOCTYPE")
-        if "</html>" not in content:
-            errors.append(f"{html_file.name}: Missing closing </html> tag")
+    for fname, content in files.items():
+        if not fname.endswith(".html"):
+            continue
+        if b"<!DOCTYPE html>" not in content and b"<!doctype html>" not in content:
+            errors.append(f"{fname}: Missing DOCTYPE")
+        if b"</html>" not in content:
+            errors.append(f"{fname}: Missing closing </html> tag")
     
     return len(errors) == 0, errors
 
@@ -389,10 +481,11 @@ def main():
     
     # Check generator has no syntax errors
     print(f"{YELLOW}[PRE-CHECK] Validating chrome_forge.py syntax...{RESET}")
-    result = subprocess.run([sys.executable, "-m", "py_compile", str(GENERATOR)], capture_output=True)
-    if result.returncode != 0:
+    try:
+        py_compile.compile(str(GENERATOR), doraise=True)
+    except py_compile.PyCompileError as e:
         print(f"{RED}SYNTAX ERROR in chrome_forge.py:{RESET}")
-        print(result.stderr.decode())
+        print(e.msg)
         sys.exit(1)
     print(f"{GREEN}✓ No syntax errors{RESET}\n")
     
@@ -406,22 +499,28 @@ def main():
         if not prompt_preview:
             prompt_preview = "(empty prompt - default)"
         
-        print(f"{BOLD}[TEST {test_id:02d}]{RESET} {test_name}")
-        print(f"         {BLUE}Prompt: {prompt_preview}{RESET}")
+        # Collect the case's lines, including any generator failure message,
+        # and write them to the terminal in one go
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            print(f"{BOLD}[TEST {test_id:02d}]{RESET} {test_name}")
+            print(f"         {BLUE}Prompt: {prompt_preview}{RESET}")
         
-        success, errors = run_test(test)
+            success, errors = run_test(test)
         
-        if success:
-            print(f"         {GREEN}✓ PASSED{RESET}")
-            passed += 1
-        else:
-            print(f"         {RED}✗ FAILED{RESET}")
-            for err in errors[:3]:  # Show max 3 errors
-                print(f"           - {err}")
-            if len(errors) > 3:
-                print(f"           - ...and {len(errors) - 3} more errors")
-            failed += 1
-        print()
+            if success:
+                print(f"         {GREEN}✓ PASSED{RESET}")
+                passed += 1
+            else:
+                print(f"         {RED}✗ FAILED{RESET}")
+                for err in errors[:3]:  # Show max 3 errors
+                    print(f"           - {err}")
+                if len(errors) > 3:
+                    print(f"           - ...and {len(errors) - 3} more errors")
+                failed += 1
+            print()
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
     
     # Summary
     print(f"{BOLD}{'='*65}{RESET}")